@@ -2,7 +2,7 @@
 Application services.
 """
 
-from crypto_bot.application.services.event_service import EventService
+from crypto_bot.application.services.event_service import EventService, EventSpec
 from crypto_bot.application.services.trading_service import TradingService
 
-__all__ = ["TradingService", "EventService"]
+__all__ = ["TradingService", "EventService", "EventSpec"]
@@ -4,7 +4,8 @@ Event sourcing service for domain events.
 Provides methods to create and persist domain events for all trading operations.
 """
 
-from datetime import UTC, datetime
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID, uuid4
 
@@ -16,6 +17,26 @@ from crypto_bot.domain.repositories.event_repository import (
 )
 
 
+@dataclass(frozen=True)
+class EventSpec:
+    """
+    Description of a domain event to emit as part of a batch.
+
+    Attributes:
+        event_type: Type of the event (e.g., 'OrderCreated').
+        aggregate_id: ID of the aggregate root.
+        aggregate_type: Type of the aggregate (e.g., 'Order').
+        payload: Event data.
+        metadata: Optional metadata.
+    """
+
+    event_type: str
+    aggregate_id: UUID
+    aggregate_type: str
+    payload: dict[str, Any]
+    metadata: dict[str, Any] | None = None
+
+
 class EventService:
     """
     Service for creating and persisting domain events.
@@ -289,6 +310,34 @@ class EventService:
         )
         return await self._event_repo.create(entity=event)
 
+    async def emit_many(self, specs: list[EventSpec]) -> list[DomainEventInterface]:
+        """
+        Emit several domain events in a single batch.
+
+        Events are stamped one microsecond apart so that replay returns
+        them in the order given.
+
+        Args:
+            specs: The events to emit, in order.
+
+        Returns:
+            The created domain events, in the same order.
+        """
+        occurred_at = datetime.now(UTC)
+        events = [
+            DomainEventInterface(
+                event_id=uuid4(),
+                event_type=spec.event_type,
+                aggregate_id=spec.aggregate_id,
+                aggregate_type=spec.aggregate_type,
+                occurred_at=occurred_at + timedelta(microseconds=offset),
+                payload=spec.payload,
+                metadata=spec.metadata or {},
+            )
+            for offset, spec in enumerate(specs)
+        ]
+        return await self._event_repo.create_many(entities=events)
+
     async def get_aggregate_events(
         self, aggregate_id: UUID, aggregate_type: str
     ) -> list[DomainEventInterface]:
@@ -49,6 +49,19 @@ class DomainEvent:
 class IEventRepository(IRepository[DomainEvent]):
     """Repository interface for Domain Events (event sourcing)."""
 
+    @abstractmethod
+    async def create_many(self, entities: list[DomainEvent]) -> list[DomainEvent]:
+        """
+        Persist several events in a single batch.
+
+        Args:
+            entities: The events to persist, in emission order.
+
+        Returns:
+            The persisted events, in the same order.
+        """
+        pass
+
     @abstractmethod
     async def get_by_aggregate(
         self, aggregate_id: UUID, aggregate_type: str, skip: int = 0, limit: int = 1000
@@ -98,6 +98,24 @@ class EventRepository(BaseRepository[DomainEventModel], IEventRepository):
             await self._session.rollback()
             raise RepositoryError(f"Failed to create domain event: {str(e)}") from e
 
+    async def create_many(
+        self, entities: list[DomainEventInterface]
+    ) -> list[DomainEventInterface]:
+        """
+        Create several domain events with one batched INSERT.
+
+        Notes:
+            - Every event carries its own ID, so the flush needs no refresh.
+        """
+        try:
+            models = [self._from_interface(entity) for entity in entities]
+            self._session.add_all(models)
+            await self._session.flush()
+            return [self._to_interface(model) for model in models]
+        except SQLAlchemyError as e:
+            await self._session.rollback()
+            raise RepositoryError(f"Failed to create domain events: {str(e)}") from e
+
     async def get_by_aggregate(
         self, aggregate_id: UUID, aggregate_type: str, skip: int = 0, limit: int = 1000
     ) -> list[DomainEventInterface]:
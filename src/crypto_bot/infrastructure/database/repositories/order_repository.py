@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from crypto_bot.domain.exceptions import RepositoryError
 from crypto_bot.domain.repositories.order_repository import IOrderRepository
@@ -49,6 +50,10 @@ class OrderRepository(BaseRepository[Order], IOrderRepository):
         try:
             stmt = (
                 select(Order)
+                .options(
+                    selectinload(Order.trading_pair),
+                    selectinload(Order.exchange),
+                )
                 .where(Order.status == status)
                 .offset(skip)
                 .limit(limit)
@@ -305,8 +305,9 @@ class CCXTExchangePlugin(ExchangeBase):
                 else None
             ),
             cost=Decimal(str(ccxt_order.get("cost", 0))),
-            fee=Decimal(str(ccxt_order.get("fee", {}).get("cost", 0))),
-            fee_currency=ccxt_order.get("fee", {}).get("currency", ""),
+            # CCXT reports ``fee: None`` for orders without fills
+            fee=Decimal(str((ccxt_order.get("fee") or {}).get("cost", 0))),
+            fee_currency=(ccxt_order.get("fee") or {}).get("currency", ""),
             timestamp=datetime.fromtimestamp(ccxt_order["timestamp"] / 1000),
             last_trade_timestamp=(
                 datetime.fromtimestamp(ccxt_order["lastTradeTimestamp"] / 1000)
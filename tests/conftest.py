@@ -10,11 +10,13 @@ from datetime import UTC, datetime
 from typing import AsyncGenerator, Generator
 
 import pytest
+import pytest_asyncio
 from faker import Faker
 from freezegun import freeze_time
 
-# Set test encryption key BEFORE importing any application modules
-os.environ["ENCRYPTION_KEY"] = "test_encryption_key_32_bytes_long!!"
+# Set test encryption key BEFORE importing any application modules, keeping
+# one the developer exported
+os.environ.setdefault("ENCRYPTION_KEY", "test_encryption_key_32_bytes_long!!")
 
 
 @pytest.fixture(scope="session")
@@ -26,10 +28,75 @@ def faker() -> Generator[Faker, None, None]:
         Faker: Faker instance with Portuguese locale support
     """
     fake = Faker()
-    Faker.seed(42)  # For reproducible test data
+    # Reproducible test data, distinct per pytest-xdist worker (gw0, gw1, ...)
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    Faker.seed(42 + int(worker.removeprefix("gw")))
     yield fake
 
 
+@pytest_asyncio.fixture(scope="session")
+async def worker_database() -> AsyncGenerator[None, None]:
+    """
+    Give each pytest-xdist worker its own copy of the test database.
+
+    Database tests create and drop the schema per module, so workers sharing
+    one database would wipe each other's tables. Each worker clones the
+    configured database (extensions included) and points the application
+    settings at the clone. Outside xdist the configured database is used as
+    is. Database fixtures request this fixture, so unit runs never touch it.
+
+    Yields:
+        None
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker is None:
+        yield
+        return
+
+    from sqlalchemy import text
+    from sqlalchemy.engine import make_url
+    from sqlalchemy.exc import SQLAlchemyError
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from crypto_bot.config.settings import settings
+    from crypto_bot.infrastructure.database import db_engine
+
+    base_url = make_url(settings.database_url)
+    worker_db = f"{base_url.database}_{worker}"
+    # CREATE/DROP DATABASE cannot run in a transaction or inside the target
+    admin_engine = create_async_engine(
+        base_url.set(drivername="postgresql+asyncpg", database="postgres"),
+        isolation_level="AUTOCOMMIT",
+    )
+    try:
+        async with admin_engine.connect() as conn:
+            await conn.execute(text(f'DROP DATABASE IF EXISTS "{worker_db}"'))
+            await conn.execute(
+                text(f'CREATE DATABASE "{worker_db}" TEMPLATE "{base_url.database}"')
+            )
+    except (OSError, SQLAlchemyError) as exc:
+        await admin_engine.dispose()
+        pytest.fail(
+            f"Could not create database {worker_db!r} for xdist worker {worker}: "
+            f"{exc}",
+            pytrace=False,
+        )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            settings,
+            "database_url",
+            base_url.set(database=worker_db).render_as_string(hide_password=False),
+        )
+        await db_engine.close()
+        yield
+        await db_engine.close()
+
+    async with admin_engine.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS "{worker_db}" WITH (FORCE)'))
+    await admin_engine.dispose()
+
+
 @pytest.fixture
 def frozen_time() -> Generator[datetime, None, None]:
     """
@@ -94,3 +161,11 @@ def pytest_configure(config: pytest.Config) -> None:
         "markers",
         "testnet: Tests that require testnet API access",
     )
+    config.addinivalue_line(
+        "markers",
+        "live: Tests that call real exchange testnets instead of the local stub",
+    )
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): Keep tests on the same pytest-xdist worker",
+    )
@@ -6,11 +6,6 @@ and system crashes, verifying that error handling, retries, and recovery
 procedures restore normal operation without data loss or inconsistent states.
 """
 
-import os
-
-# Set test encryption key BEFORE importing any application modules
-os.environ["ENCRYPTION_KEY"] = "test_encryption_key_32_bytes_long!!"
-
 from datetime import UTC, datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -59,7 +54,7 @@ from crypto_bot.plugins.strategies.base import StrategySignal
 
 
 @pytest_asyncio.fixture(scope="function")
-async def setup_database():
+async def setup_database(worker_database):
     """Create all tables before each test and drop them after."""
     await db_engine.close()
     engine = db_engine.create_engine()
@@ -6,11 +6,6 @@ through order execution to position management, validating system state transiti
 and data consistency across all components.
 """
 
-import os
-
-# Set test encryption key BEFORE importing any application modules
-os.environ["ENCRYPTION_KEY"] = "test_encryption_key_32_bytes_long!!"
-
 from datetime import UTC, datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -82,7 +77,7 @@ from crypto_bot.plugins.strategies.base import StrategySignal
 
 
 @pytest_asyncio.fixture(scope="function")
-async def setup_database():
+async def setup_database(worker_database):
     """Create all tables before each test and drop them after."""
     # Reset engine to avoid event loop issues
     await db_engine.close()
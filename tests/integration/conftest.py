@@ -0,0 +1,162 @@
+"""
+Pytest configuration and shared fixtures for integration tests.
+
+This module provides the database fixtures shared by the integration
+test modules that talk to the configured database.
+"""
+
+import asyncio
+from typing import Any, AsyncGenerator, Awaitable, Callable
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_mock_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+# Register every model on Base.metadata before the schema DDL is compiled
+import crypto_bot.infrastructure.database.models  # noqa: F401
+from crypto_bot.config.settings import settings
+from crypto_bot.infrastructure.database import Base
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run the integration tests on uvloop where it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+def _skip_commit_fsync(dbapi_connection: Any, connection_record: Any) -> None:
+    """Turn off synchronous_commit on a freshly opened test connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("SET synchronous_commit TO OFF")
+    cursor.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def engine(worker_database: None) -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Provide one database engine for the whole test session.
+
+    Its connection pool stays warm across tests instead of being rebuilt by
+    every fixture. It is separate from the ``db_engine`` singleton, so tests
+    that close the application engine do not dispose of it. Test data is
+    disposable, so its connections commit without waiting for the WAL to
+    reach disk.
+
+    Yields:
+        AsyncEngine: Engine created from the configured database URL
+    """
+    url = make_url(settings.database_url).set(drivername="postgresql+asyncpg")
+    shared_engine = create_async_engine(url)
+    event.listen(shared_engine.sync_engine, "connect", _skip_commit_fsync)
+    yield shared_engine
+    await shared_engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """
+    Provide a session factory on the shared engine.
+
+    It uses the same session options as the application's ``db_engine``.
+
+    Returns:
+        async_sessionmaker[AsyncSession]: Factory bound to the shared engine
+    """
+    return async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+
+@pytest.fixture(scope="session")
+def drop_schema(engine: AsyncEngine) -> Callable[[], Awaitable[None]]:
+    """
+    Provide a coroutine that drops every model table with one statement.
+
+    ``Base.metadata.drop_all`` reflects the catalog and emits one DROP per
+    table on every call. The statement is instead built once from the
+    metadata; ``IF EXISTS`` and ``CASCADE`` make it safe on an empty or
+    partially built schema.
+
+    Returns:
+        Callable[[], Awaitable[None]]: Coroutine function dropping the schema
+    """
+    preparer = engine.dialect.identifier_preparer
+    statement = "DROP TABLE IF EXISTS {} CASCADE".format(
+        ", ".join(
+            preparer.format_table(table)
+            for table in reversed(Base.metadata.sorted_tables)
+        )
+    )
+
+    async def _drop_schema() -> None:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql(statement)
+
+    return _drop_schema
+
+
+@pytest.fixture(scope="session")
+def create_schema(
+    engine: AsyncEngine, drop_schema: Callable[[], Awaitable[None]]
+) -> Callable[[], Awaitable[None]]:
+    """
+    Provide a coroutine that rebuilds the schema from precompiled DDL.
+
+    ``Base.metadata.create_all`` walks the metadata, queries the catalog for
+    every table and type, and compiles each statement again on every call.
+    The CREATE statements are instead captured once through a mock engine
+    and replayed as plain SQL; any existing tables are dropped first.
+
+    Returns:
+        Callable[[], Awaitable[None]]: Coroutine function creating the schema
+    """
+    statements: list[str] = []
+
+    def _capture(ddl: Any, *multiparams: Any, **params: Any) -> None:
+        statements.append(str(ddl.compile(dialect=engine.dialect)))
+
+    mock_engine = create_mock_engine(engine.url, _capture)
+    Base.metadata.create_all(mock_engine, checkfirst=False)
+
+    async def _create_schema() -> None:
+        await drop_schema()
+        async with engine.begin() as conn:
+            for statement in statements:
+                await conn.exec_driver_sql(statement)
+
+    return _create_schema
+
+
+@pytest_asyncio.fixture
+async def db_session(
+    engine: AsyncEngine,
+    session_factory: async_sessionmaker[AsyncSession],
+    setup_database: None,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide a database session whose changes are rolled back after the test.
+
+    The session joins a connection-level transaction, so commits inside the
+    test only release a SAVEPOINT. Test modules provide ``setup_database``
+    to build the schema the session needs.
+
+    Yields:
+        AsyncSession: Session bound to the test's outer transaction
+    """
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        async with session_factory(
+            bind=conn, join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
+        await transaction.rollback()
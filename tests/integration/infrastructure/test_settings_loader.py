@@ -5,8 +5,10 @@ Tests loading and validation of configuration from YAML files.
 """
 
 import os
+from collections.abc import Iterator
 from decimal import Decimal
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -18,89 +20,78 @@ from crypto_bot.infrastructure.config.settings import (
     reload_settings,
 )
 
+CONFIG_ROOT = Path(__file__).resolve().parents[3] / "config" / "environments"
+
+
+@pytest.fixture(autouse=True)
+def _reset_settings_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Start every test from an empty settings cache in the development env."""
+    get_settings.cache_clear()
+    monkeypatch.setenv("CRYPTOBOT_ENV", "development")
+    yield
+
+
+@pytest.fixture(scope="module")
+def dev_settings() -> Settings:
+    """Development settings loaded once for read-only assertions."""
+    return get_settings("development")
+
 
 class TestLoadYamlConfig:
     """Tests for YAML configuration loading."""
 
-    def test_load_base_config(self) -> None:
-        """Test loading base configuration file."""
-        config_path = (
-            Path(__file__).parent.parent.parent.parent
-            / "config"
-            / "environments"
-            / "base.yaml"
-        )
-        config = load_yaml_config(config_path)
-
-        assert "app" in config
-        assert "database" in config
-        assert "trading" in config
-        assert config["app"]["name"] == "Crypto Trading Bot"
-
-    def test_load_development_config(self) -> None:
-        """Test loading development configuration file."""
-        config_path = (
-            Path(__file__).parent.parent.parent.parent
-            / "config"
-            / "environments"
-            / "development.yaml"
-        )
-        config = load_yaml_config(config_path)
-
-        assert "app" in config
-        assert config["app"]["log_level"] == "DEBUG"
+    @pytest.mark.parametrize(
+        "name,key,expected",
+        [
+            ("base.yaml", "app.name", "Crypto Trading Bot"),
+            ("development.yaml", "app.log_level", "DEBUG"),
+        ],
+    )
+    def test_load_config(self, name: str, key: str, expected: str) -> None:
+        """Test loading environment configuration files."""
+        config = load_yaml_config(CONFIG_ROOT / name)
+
+        assert {"app", "database", "trading"} <= config.keys()
+        section, field = key.split(".")
+        assert config[section][field] == expected
 
     def test_load_nonexistent_file(self) -> None:
         """Test that loading nonexistent file raises FileNotFoundError."""
-        config_path = Path("nonexistent.yaml")
         with pytest.raises(FileNotFoundError):
-            load_yaml_config(config_path)
+            load_yaml_config(CONFIG_ROOT / "nonexistent.yaml")
 
 
 class TestMergeConfigs:
     """Tests for configuration merging."""
 
-    def test_merge_simple_configs(self) -> None:
-        """Test merging simple configurations."""
-        config1 = {"a": 1, "b": 2}
-        config2 = {"b": 3, "c": 4}
-
-        result = merge_configs(config1, config2)
-
-        assert result == {"a": 1, "b": 3, "c": 4}
-
-    def test_merge_nested_configs(self) -> None:
-        """Test merging nested configurations."""
-        config1 = {"app": {"name": "Bot", "version": "1.0"}}
-        config2 = {"app": {"version": "2.0", "debug": True}}
-
-        result = merge_configs(config1, config2)
-
-        assert result == {"app": {"name": "Bot", "version": "2.0", "debug": True}}
-
-    def test_merge_multiple_configs(self) -> None:
-        """Test merging more than two configurations."""
-        config1 = {"a": 1}
-        config2 = {"b": 2}
-        config3 = {"c": 3}
-
-        result = merge_configs(config1, config2, config3)
-
-        assert result == {"a": 1, "b": 2, "c": 3}
+    @pytest.mark.parametrize(
+        "inputs,expected",
+        [
+            (({"a": 1, "b": 2}, {"b": 3, "c": 4}), {"a": 1, "b": 3, "c": 4}),
+            (
+                (
+                    {"app": {"name": "Bot", "version": "1.0"}},
+                    {"app": {"version": "2.0", "debug": True}},
+                ),
+                {"app": {"name": "Bot", "version": "2.0", "debug": True}},
+            ),
+            (({"a": 1}, {"b": 2}, {"c": 3}), {"a": 1, "b": 2, "c": 3}),
+        ],
+        ids=["simple", "nested", "multiple"],
+    )
+    def test_merge(
+        self, inputs: tuple[dict[str, Any], ...], expected: dict[str, Any]
+    ) -> None:
+        """Test merging configurations, later ones taking precedence."""
+        assert merge_configs(*inputs) == expected
 
 
 class TestGetSettings:
     """Tests for settings loader with caching."""
 
-    def test_get_settings_development(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_get_settings_development(self, dev_settings: Settings) -> None:
         """Test loading development settings."""
-        # Clear cache before test
-        get_settings.cache_clear()
-
-        # Set environment
-        monkeypatch.setenv("CRYPTOBOT_ENV", "development")
-
-        settings = get_settings()
+        settings = dev_settings
 
         assert isinstance(settings, Settings)
         assert settings.app.name == "Crypto Trading Bot"
@@ -108,14 +99,9 @@ class TestGetSettings:
         assert settings.database.host == "localhost"
         assert settings.trading.dry_run is True
 
-    def test_get_settings_validates_risk_config(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_get_settings_validates_risk_config(self, dev_settings: Settings) -> None:
         """Test that risk configuration is properly validated."""
-        get_settings.cache_clear()
-        monkeypatch.setenv("CRYPTOBOT_ENV", "development")
-
-        settings = get_settings()
+        settings = dev_settings
 
         # Check risk configuration structure
         assert settings.trading.risk is not None
@@ -130,13 +116,8 @@ class TestGetSettings:
             == Decimal("15.0")
         )
 
-    def test_reload_settings_clears_cache(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_reload_settings_clears_cache(self) -> None:
         """Test that reload_settings clears cache."""
-        get_settings.cache_clear()
-        monkeypatch.setenv("CRYPTOBOT_ENV", "development")
-
         # Load settings once
         settings1 = get_settings()
 
@@ -146,11 +127,8 @@ class TestGetSettings:
         # Both should have same values but force reload happened
         assert settings1.app.name == settings2.app.name
 
-    def test_settings_caching_works(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_settings_caching_works(self) -> None:
         """Test that settings are cached between calls."""
-        get_settings.cache_clear()
-        monkeypatch.setenv("CRYPTOBOT_ENV", "development")
-
         # Load settings twice
         settings1 = get_settings()
         settings2 = get_settings()
@@ -160,8 +138,6 @@ class TestGetSettings:
 
     def test_environment_override_works(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that environment variables override config."""
-        get_settings.cache_clear()
-        monkeypatch.setenv("CRYPTOBOT_ENV", "development")
         monkeypatch.setenv("CRYPTOBOT_APP__LOG_LEVEL", "ERROR")
 
         settings = get_settings()
@@ -173,21 +149,14 @@ class TestGetSettings:
 class TestSettingsValidation:
     """Tests for settings validation."""
 
-    def test_valid_base_configuration(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_valid_base_configuration(self, dev_settings: Settings) -> None:
         """Test that base configuration is valid."""
-        get_settings.cache_clear()
-        monkeypatch.setenv("CRYPTOBOT_ENV", "development")
-
-        # Should not raise ValidationError
-        settings = get_settings()
-        assert settings is not None
+        # Loading the fixture would have raised ValidationError
+        assert dev_settings is not None
 
-    def test_exchanges_configuration(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_exchanges_configuration(self, dev_settings: Settings) -> None:
         """Test exchanges configuration loading."""
-        get_settings.cache_clear()
-        monkeypatch.setenv("CRYPTOBOT_ENV", "development")
-
-        settings = get_settings()
+        settings = dev_settings
 
         assert settings.exchanges.binance.enabled is True
         assert settings.exchanges.binance.sandbox is True
@@ -197,12 +166,9 @@ class TestSettingsValidation:
 class TestEnvironmentSpecificSettings:
     """Tests for environment-specific settings."""
 
-    def test_development_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_development_environment(self, dev_settings: Settings) -> None:
         """Test development-specific settings."""
-        get_settings.cache_clear()
-        monkeypatch.setenv("CRYPTOBOT_ENV", "development")
-
-        settings = get_settings()
+        settings = dev_settings
 
         assert settings.app.log_level == "DEBUG"
         assert settings.database.echo is True
@@ -212,8 +178,6 @@ class TestEnvironmentSpecificSettings:
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test that default environment is development."""
-        get_settings.cache_clear()
-        # Don't set CRYPTOBOT_ENV
         monkeypatch.delenv("CRYPTOBOT_ENV", raising=False)
 
         settings = get_settings()
@@ -3,15 +3,23 @@ Integration tests for exchange plugin system.
 """
 
 import asyncio
-import tempfile
+import dataclasses
+import py_compile
 from datetime import datetime
 from decimal import Decimal
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
-from crypto_bot.application.dtos.order import CreateOrderRequest, OrderSide, OrderType
+from crypto_bot.application.dtos.order import (
+    BalanceDTO,
+    CreateOrderRequest,
+    OrderDTO,
+    OrderSide,
+    OrderStatus,
+    OrderStatusDTO,
+    OrderType,
+)
 from crypto_bot.infrastructure.exchanges.base import ExchangeBase
 from crypto_bot.plugins.registry import (
     ExchangePluginRegistry,
@@ -19,6 +27,63 @@ from crypto_bot.plugins.registry import (
     PluginValidationError,
 )
 
+_D0 = Decimal("0")
+_D1 = Decimal("1")
+_D50K = Decimal("50000")
+
+
+class _BalRow:
+    """Per-currency balance amounts held by the test plugin."""
+
+    __slots__ = ("free", "used", "total")
+
+    def __init__(self, free: Decimal, used: Decimal, total: Decimal) -> None:
+        self.free = free
+        self.used = used
+        self.total = total
+
+
+# Source of the on-disk plugin used by the discovery tests
+_PLUGIN_SRC = """
+from crypto_bot.infrastructure.exchanges.base import ExchangeBase
+from crypto_bot.application.dtos.order import CreateOrderRequest, OrderDTO, OrderStatusDTO, BalanceDTO, OrderSide, OrderType
+from decimal import Decimal
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Union
+
+class TestExchangePlugin(ExchangeBase):
+    name = "Test Exchange"
+    id = "test_exchange"
+    countries = ["US", "GB"]
+    urls = {"api": "https://api.testexchange.com"}
+    version = "2.0.0"
+    certified = True
+    has = {"createOrder": True, "fetchBalance": True, "fetchTicker": True}
+    
+    async def initialize(self): self._initialized = True
+    async def load_markets(self, reload=False): return {"BTC/USDT": {"id": "BTCUSDT"}}
+    async def fetch_markets(self): return [{"id": "BTCUSDT", "symbol": "BTC/USDT"}]
+    async def fetch_ticker(self, symbol): return {"symbol": symbol, "last": 50000.0}
+    async def fetch_tickers(self, symbols=None): return {"BTC/USDT": await self.fetch_ticker("BTC/USDT")}
+    async def fetch_order_book(self, symbol, limit=None): return {"symbol": symbol, "bids": [], "asks": []}
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None): return []
+    async def fetch_trades(self, symbol, since=None, limit=None): return []
+    async def create_order(self, request): return OrderDTO(id="test", exchange_order_id="ex_test", exchange="Test", symbol=request.symbol, side=request.side, type=request.type, status=OrderSide.BUY, quantity=request.quantity, filled_quantity=Decimal("0"), remaining_quantity=request.quantity, price=request.price, average_price=None, cost=Decimal("0"), fee=Decimal("0"), fee_currency="USDT", timestamp=datetime.now(), last_trade_timestamp=None)
+    async def cancel_order(self, order_id, symbol=None): return OrderDTO(id=order_id, exchange_order_id=order_id, exchange="Test", symbol="BTC/USDT", side=OrderSide.BUY, type=OrderType.LIMIT, status=OrderSide.BUY, quantity=Decimal("1"), filled_quantity=Decimal("0"), remaining_quantity=Decimal("1"), price=Decimal("50000"), average_price=None, cost=Decimal("0"), fee=Decimal("0"), fee_currency="USDT", timestamp=datetime.now(), last_trade_timestamp=None)
+    async def fetch_order(self, order_id, symbol=None): return OrderDTO(id=order_id, exchange_order_id=order_id, exchange="Test", symbol="BTC/USDT", side=OrderSide.BUY, type=OrderType.LIMIT, status=OrderSide.BUY, quantity=Decimal("1"), filled_quantity=Decimal("0"), remaining_quantity=Decimal("1"), price=Decimal("50000"), average_price=None, cost=Decimal("0"), fee=Decimal("0"), fee_currency="USDT", timestamp=datetime.now(), last_trade_timestamp=None)
+    async def fetch_order_status(self, order_id, symbol=None): return OrderStatusDTO(order_id=order_id, status=OrderSide.BUY, filled_quantity=Decimal("0"), remaining_quantity=Decimal("1"), average_price=None, last_update=datetime.now())
+    async def fetch_open_orders(self, symbol=None): return []
+    async def cancel_all_orders(self, symbol=None): return []
+    async def fetch_balance(self, currency=None): return BalanceDTO(exchange="Test", currency="USDT", free=Decimal("10000"), used=Decimal("0"), total=Decimal("10000"), timestamp=datetime.now())
+    async def fetch_positions(self, symbols=None): return []
+    async def fetch_my_trades(self, symbol=None, since=None, limit=None): return []
+    def amount_to_precision(self, symbol, amount): return str(amount)
+    def price_to_precision(self, symbol, price): return str(price)
+    def cost_to_precision(self, symbol, cost): return str(cost)
+    def currency_to_precision(self, currency, amount): return str(amount)
+    async def close(self): self._initialized = False
+"""
+
 
 class TestExchangePlugin(ExchangeBase):
     """Test exchange plugin for integration testing."""
@@ -45,10 +110,40 @@ class TestExchangePlugin(ExchangeBase):
         "fetchMyTrades": True,
     }
 
+    # Response templates built once; methods only replace the dynamic fields
+    _ORDER_TEMPLATE = OrderDTO(
+        id="",
+        exchange_order_id="",
+        exchange=name,
+        symbol="BTC/USDT",
+        side=OrderSide.BUY,
+        type=OrderType.LIMIT,
+        status=OrderStatus.OPEN,
+        quantity=_D1,
+        filled_quantity=_D0,
+        remaining_quantity=_D1,
+        price=_D50K,
+        average_price=None,
+        cost=_D0,
+        fee=_D0,
+        fee_currency="USDT",
+        timestamp=datetime(2024, 1, 1),
+        last_trade_timestamp=None,
+    )
+    _BALANCE_TEMPLATE = BalanceDTO(
+        exchange=name,
+        currency="USDT",
+        free=_D0,
+        used=_D0,
+        total=_D0,
+        timestamp=datetime(2024, 1, 1),
+    )
+
     def __init__(
         self, api_key: str = None, secret: str = None, sandbox: bool = False, **kwargs
     ):
         super().__init__(api_key, secret, sandbox, **kwargs)
+        self._refresh_now()
         self._test_data = {
             "markets": {
                 "BTC/USDT": {
@@ -60,7 +155,6 @@ class TestExchangePlugin(ExchangeBase):
                 }
             },
             "ticker": {
-                "symbol": "BTC/USDT",
                 "last": 50000.0,
                 "bid": 49999.0,
                 "ask": 50001.0,
@@ -68,14 +162,22 @@ class TestExchangePlugin(ExchangeBase):
                 "low": 49000.0,
                 "volume": 1000.0,
             },
-            "balance": {
-                "USDT": {"free": 10000.0, "used": 0.0, "total": 10000.0},
-                "BTC": {"free": 0.5, "used": 0.0, "total": 0.5},
-            },
+        }
+        # Ticker fields shared by every symbol; symbol/timestamp added per call
+        self._ticker_template = self._test_data["ticker"]
+        self._balances = {
+            "USDT": _BalRow(Decimal("10000"), _D0, Decimal("10000")),
+            "BTC": _BalRow(Decimal("0.5"), _D0, Decimal("0.5")),
         }
 
+    def _refresh_now(self) -> None:
+        """Snapshot the clock once; mock responses reuse this timestamp."""
+        self._now = datetime.now()
+        self._ts_ms = int(self._now.timestamp() * 1000)
+
     async def initialize(self) -> None:
         """Initialize the exchange."""
+        self._refresh_now()
         self._initialized = True
 
     async def load_markets(self, reload: bool = False) -> dict:
@@ -88,20 +190,17 @@ class TestExchangePlugin(ExchangeBase):
 
     async def fetch_ticker(self, symbol: str) -> dict:
         """Fetch ticker data."""
-        ticker = self._test_data["ticker"].copy()
-        ticker["symbol"] = symbol
-        ticker["timestamp"] = datetime.now()
-        return ticker
+        return {**self._ticker_template, "symbol": symbol, "timestamp": self._now}
 
     async def fetch_tickers(self, symbols=None) -> dict:
         """Fetch ticker data for multiple symbols."""
         if symbols is None:
             symbols = ["BTC/USDT"]
 
-        result = {}
-        for symbol in symbols:
-            result[symbol] = await self.fetch_ticker(symbol)
-        return result
+        return {
+            symbol: {**self._ticker_template, "symbol": symbol, "timestamp": self._now}
+            for symbol in symbols
+        }
 
     async def fetch_order_book(self, symbol: str, limit=None) -> dict:
         """Fetch order book."""
@@ -109,14 +208,12 @@ class TestExchangePlugin(ExchangeBase):
             "symbol": symbol,
             "bids": [[49999.0, 1.0], [49998.0, 2.0]],
             "asks": [[50001.0, 1.0], [50002.0, 2.0]],
-            "timestamp": datetime.now(),
+            "timestamp": self._now,
         }
 
     async def fetch_ohlcv(self, symbol: str, timeframe="1m", since=None, limit=None):
         """Fetch OHLCV data."""
-        now = datetime.now()
-        timestamp = int(now.timestamp() * 1000)
-        return [[timestamp, 50000.0, 51000.0, 49000.0, 50000.0, 1000.0]]
+        return [[self._ts_ms, 50000.0, 51000.0, 49000.0, 50000.0, 1000.0]]
 
     async def fetch_trades(self, symbol: str, since=None, limit=None):
         """Fetch recent trades."""
@@ -127,93 +224,71 @@ class TestExchangePlugin(ExchangeBase):
                 "side": "buy",
                 "amount": 1.0,
                 "price": 50000.0,
-                "timestamp": datetime.now(),
+                "timestamp": self._now,
             }
         ]
 
+    def _make_order(
+        self,
+        *,
+        id: str,
+        status: OrderStatus,
+        symbol: str,
+        exchange_order_id: str | None = None,
+        side: OrderSide = OrderSide.BUY,
+        type: OrderType = OrderType.LIMIT,
+        quantity: Decimal = _D1,
+        price: Decimal | None = _D50K,
+    ) -> OrderDTO:
+        """Build an order response from the template and the current timestamp."""
+        return dataclasses.replace(
+            self._ORDER_TEMPLATE,
+            id=id,
+            exchange_order_id=exchange_order_id or id,
+            symbol=symbol,
+            side=side,
+            type=type,
+            status=status,
+            quantity=quantity,
+            remaining_quantity=quantity,
+            price=price,
+            timestamp=self._now,
+        )
+
     async def create_order(self, request: CreateOrderRequest):
         """Create a new order."""
-        from crypto_bot.application.dtos.order import OrderDTO, OrderStatus
-
-        return OrderDTO(
-            id=f"test_{int(datetime.now().timestamp() * 1000)}",
-            exchange_order_id=f"ex_{int(datetime.now().timestamp() * 1000)}",
-            exchange=self.name,
+        return self._make_order(
+            id=f"test_{self._ts_ms}",
+            exchange_order_id=f"ex_{self._ts_ms}",
+            status=OrderStatus.OPEN,
             symbol=request.symbol,
             side=request.side,
             type=request.type,
-            status=OrderStatus.OPEN,
             quantity=request.quantity,
-            filled_quantity=Decimal("0"),
-            remaining_quantity=request.quantity,
             price=request.price,
-            average_price=None,
-            cost=Decimal("0"),
-            fee=Decimal("0"),
-            fee_currency="USDT",
-            timestamp=datetime.now(),
-            last_trade_timestamp=None,
         )
 
     async def cancel_order(self, order_id: str, symbol=None):
         """Cancel an order."""
-        from crypto_bot.application.dtos.order import OrderDTO, OrderStatus
-
-        return OrderDTO(
-            id=order_id,
-            exchange_order_id=order_id,
-            exchange=self.name,
-            symbol=symbol or "BTC/USDT",
-            side=OrderSide.BUY,
-            type=OrderType.LIMIT,
-            status=OrderStatus.CANCELED,
-            quantity=Decimal("1"),
-            filled_quantity=Decimal("0"),
-            remaining_quantity=Decimal("1"),
-            price=Decimal("50000"),
-            average_price=None,
-            cost=Decimal("0"),
-            fee=Decimal("0"),
-            fee_currency="USDT",
-            timestamp=datetime.now(),
-            last_trade_timestamp=None,
+        return self._make_order(
+            id=order_id, status=OrderStatus.CANCELED, symbol=symbol or "BTC/USDT"
         )
 
     async def fetch_order(self, order_id: str, symbol=None):
         """Fetch order details."""
-        from crypto_bot.application.dtos.order import OrderDTO, OrderStatus
-
-        return OrderDTO(
-            id=order_id,
-            exchange_order_id=order_id,
-            exchange=self.name,
-            symbol=symbol or "BTC/USDT",
-            side=OrderSide.BUY,
-            type=OrderType.LIMIT,
-            status=OrderStatus.OPEN,
-            quantity=Decimal("1"),
-            filled_quantity=Decimal("0"),
-            remaining_quantity=Decimal("1"),
-            price=Decimal("50000"),
-            average_price=None,
-            cost=Decimal("0"),
-            fee=Decimal("0"),
-            fee_currency="USDT",
-            timestamp=datetime.now(),
-            last_trade_timestamp=None,
+        return self._make_order(
+            id=order_id, status=OrderStatus.OPEN, symbol=symbol or "BTC/USDT"
         )
 
     async def fetch_order_status(self, order_id: str, symbol=None):
         """Fetch order status."""
-        from crypto_bot.application.dtos.order import OrderStatus, OrderStatusDTO
-
         return OrderStatusDTO(
             order_id=order_id,
             status=OrderStatus.OPEN,
-            filled_quantity=Decimal("0"),
-            remaining_quantity=Decimal("1"),
+            filled_quantity=_D0,
+            remaining_quantity=_D1,
             average_price=None,
-            last_update=datetime.now(),
+            last_update=self._now,
         )
 
     async def fetch_open_orders(self, symbol=None):
@@ -226,29 +301,22 @@ class TestExchangePlugin(ExchangeBase):
 
     async def fetch_balance(self, currency=None):
         """Fetch account balance."""
-        from crypto_bot.application.dtos.order import BalanceDTO
-
         balances = {}
-        for curr, data in self._test_data["balance"].items():
-            balances[curr] = BalanceDTO(
-                exchange=self.name,
+        for curr, row in self._balances.items():
+            balances[curr] = dataclasses.replace(
+                self._BALANCE_TEMPLATE,
                 currency=curr,
-                free=Decimal(str(data["free"])),
-                used=Decimal(str(data["used"])),
-                total=Decimal(str(data["total"])),
-                timestamp=datetime.now(),
+                free=row.free,
+                used=row.used,
+                total=row.total,
+                timestamp=self._now,
             )
 
         if currency:
             return balances.get(
                 currency,
-                BalanceDTO(
-                    exchange=self.name,
-                    currency=currency,
-                    free=Decimal("0"),
-                    used=Decimal("0"),
-                    total=Decimal("0"),
-                    timestamp=datetime.now(),
+                dataclasses.replace(
+                    self._BALANCE_TEMPLATE, currency=currency, timestamp=self._now
                 ),
             )
         else:
@@ -283,60 +351,58 @@ class TestExchangePlugin(ExchangeBase):
         self._initialized = False
 
 
+class _AbstractPlugin(ExchangeBase):
+    """Plugin that implements nothing."""
+
+
+class _PartialPlugin(ExchangeBase):
+    """Plugin with metadata but no exchange methods."""
+
+    name = "Partial Exchange"
+    id = "partial_exchange"
+    countries = ["US"]
+    urls = {"api": "https://api.partial.example"}
+    version = "1.0.0"
+
+
+class _NotAnExchange:
+    """Class that looks like a plugin but does not subclass ExchangeBase."""
+
+    name = "Impostor"
+    id = "impostor"
+
+
+def _preloaded_registry() -> ExchangePluginRegistry:
+    """Build a registry with TestExchangePlugin injected, skipping disk discovery."""
+    registry = ExchangePluginRegistry(None)
+    registry._plugins["test_exchange"] = TestExchangePlugin
+    registry._loaded = True
+    return registry
+
+
 class TestExchangePluginIntegration:
     """Integration tests for exchange plugin system."""
 
-    @pytest.fixture
-    def temp_plugin_dir(self):
-        """Create a temporary directory with test plugins."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            plugin_dir = Path(temp_dir) / "exchanges"
-            plugin_dir.mkdir()
-
-            # Create a test plugin file
-            plugin_file = plugin_dir / "test_exchange.py"
-            plugin_content = """
-from crypto_bot.infrastructure.exchanges.base import ExchangeBase
-from crypto_bot.application.dtos.order import CreateOrderRequest, OrderDTO, OrderStatusDTO, BalanceDTO, OrderSide, OrderType
-from decimal import Decimal
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-
-class TestExchangePlugin(ExchangeBase):
-    name = "Test Exchange"
-    id = "test_exchange"
-    countries = ["US", "GB"]
-    urls = {"api": "https://api.testexchange.com"}
-    version = "2.0.0"
-    certified = True
-    has = {"createOrder": True, "fetchBalance": True, "fetchTicker": True}
-    
-    async def initialize(self): self._initialized = True
-    async def load_markets(self, reload=False): return {"BTC/USDT": {"id": "BTCUSDT"}}
-    async def fetch_markets(self): return [{"id": "BTCUSDT", "symbol": "BTC/USDT"}]
-    async def fetch_ticker(self, symbol): return {"symbol": symbol, "last": 50000.0}
-    async def fetch_tickers(self, symbols=None): return {"BTC/USDT": await self.fetch_ticker("BTC/USDT")}
-    async def fetch_order_book(self, symbol, limit=None): return {"symbol": symbol, "bids": [], "asks": []}
-    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None): return []
-    async def fetch_trades(self, symbol, since=None, limit=None): return []
-    async def create_order(self, request): return OrderDTO(id="test", exchange_order_id="ex_test", exchange="Test", symbol=request.symbol, side=request.side, type=request.type, status=OrderSide.BUY, quantity=request.quantity, filled_quantity=Decimal("0"), remaining_quantity=request.quantity, price=request.price, average_price=None, cost=Decimal("0"), fee=Decimal("0"), fee_currency="USDT", timestamp=datetime.now(), last_trade_timestamp=None)
-    async def cancel_order(self, order_id, symbol=None): return OrderDTO(id=order_id, exchange_order_id=order_id, exchange="Test", symbol="BTC/USDT", side=OrderSide.BUY, type=OrderType.LIMIT, status=OrderSide.BUY, quantity=Decimal("1"), filled_quantity=Decimal("0"), remaining_quantity=Decimal("1"), price=Decimal("50000"), average_price=None, cost=Decimal("0"), fee=Decimal("0"), fee_currency="USDT", timestamp=datetime.now(), last_trade_timestamp=None)
-    async def fetch_order(self, order_id, symbol=None): return OrderDTO(id=order_id, exchange_order_id=order_id, exchange="Test", symbol="BTC/USDT", side=OrderSide.BUY, type=OrderType.LIMIT, status=OrderSide.BUY, quantity=Decimal("1"), filled_quantity=Decimal("0"), remaining_quantity=Decimal("1"), price=Decimal("50000"), average_price=None, cost=Decimal("0"), fee=Decimal("0"), fee_currency="USDT", timestamp=datetime.now(), last_trade_timestamp=None)
-    async def fetch_order_status(self, order_id, symbol=None): return OrderStatusDTO(order_id=order_id, status=OrderSide.BUY, filled_quantity=Decimal("0"), remaining_quantity=Decimal("1"), average_price=None, last_update=datetime.now())
-    async def fetch_open_orders(self, symbol=None): return []
-    async def cancel_all_orders(self, symbol=None): return []
-    async def fetch_balance(self, currency=None): return BalanceDTO(exchange="Test", currency="USDT", free=Decimal("10000"), used=Decimal("0"), total=Decimal("10000"), timestamp=datetime.now())
-    async def fetch_positions(self, symbols=None): return []
-    async def fetch_my_trades(self, symbol=None, since=None, limit=None): return []
-    def amount_to_precision(self, symbol, amount): return str(amount)
-    def price_to_precision(self, symbol, price): return str(price)
-    def cost_to_precision(self, symbol, cost): return str(cost)
-    def currency_to_precision(self, currency, amount): return str(amount)
-    async def close(self): self._initialized = False
-"""
-            plugin_file.write_text(plugin_content)
+    @pytest.fixture(scope="session")
+    def temp_plugin_dir(self, tmp_path_factory: pytest.TempPathFactory) -> str:
+        """Create a temporary directory with test plugins (once per session)."""
+        plugin_dir = tmp_path_factory.mktemp("plugins") / "exchanges"
+        plugin_dir.mkdir()
+        plugin_file = plugin_dir / "test_exchange.py"
+        plugin_file.write_text(_PLUGIN_SRC)
+        # Byte-compile into __pycache__ up front so importlib loads cached bytecode
+        py_compile.compile(str(plugin_file), doraise=True)
+        return str(plugin_dir)
+
+    @pytest.fixture(scope="session")
+    def preloaded_registry(self) -> ExchangePluginRegistry:
+        """Shared in-memory registry for tests that do not exercise discovery."""
+        return _preloaded_registry()
 
-            yield str(plugin_dir)
+    @pytest.fixture
+    def fresh_registry(self) -> ExchangePluginRegistry:
+        """Per-test in-memory registry for tests that unload or count instances."""
+        return _preloaded_registry()
 
     def test_plugin_discovery_and_loading(self, temp_plugin_dir):
         """Test plugin discovery and loading from directory."""
@@ -357,10 +423,9 @@ class TestExchangePlugin(ExchangeBase):
         assert plugin_info["version"] == "2.0.0"
         assert plugin_info["certified"] is True
 
-    def test_plugin_instantiation_and_usage(self, temp_plugin_dir):
+    def test_plugin_instantiation_and_usage(self, preloaded_registry):
         """Test plugin instantiation and basic usage."""
-        registry = ExchangePluginRegistry(temp_plugin_dir)
-        registry.load_plugins()
+        registry = preloaded_registry
 
         # Create plugin instance
         instance = registry.get_exchange("test_exchange", api_key="test_key")
@@ -371,11 +436,9 @@ class TestExchangePlugin(ExchangeBase):
         assert instance.certified is True
         assert not instance._initialized
 
-    @pytest.mark.asyncio
-    async def test_plugin_async_operations(self, temp_plugin_dir):
+    async def test_plugin_async_operations(self, preloaded_registry):
         """Test async operations with plugin instance."""
-        registry = ExchangePluginRegistry(temp_plugin_dir)
-        registry.load_plugins()
+        registry = preloaded_registry
 
         # Create plugin instance
         instance = registry.get_exchange("test_exchange", api_key="test_key")
@@ -384,23 +447,6 @@ class TestExchangePlugin(ExchangeBase):
         await instance.initialize()
         assert instance._initialized
 
-        # Test market operations
-        markets = await instance.load_markets()
-        assert "BTC/USDT" in markets
-
-        ticker = await instance.fetch_ticker("BTC/USDT")
-        assert ticker["symbol"] == "BTC/USDT"
-        assert ticker["last"] == 50000.0
-
-        # Test order operations
-        from decimal import Decimal
-
-        from crypto_bot.application.dtos.order import (
-            CreateOrderRequest,
-            OrderSide,
-            OrderType,
-        )
-
         order_request = CreateOrderRequest(
             exchange="test_exchange",
             symbol="BTC/USDT",
@@ -410,12 +456,22 @@ class TestExchangePlugin(ExchangeBase):
             price=Decimal("50000"),
         )
 
-        order = await instance.create_order(order_request)
+        # Market, order and balance calls are independent: issue them together
+        markets, ticker, order, balance = await asyncio.gather(
+            instance.load_markets(),
+            instance.fetch_ticker("BTC/USDT"),
+            instance.create_order(order_request),
+            instance.fetch_balance("USDT"),
+        )
+
+        assert "BTC/USDT" in markets
+
+        assert ticker["symbol"] == "BTC/USDT"
+        assert ticker["last"] == 50000.0
+
         assert order.symbol == "BTC/USDT"
         assert order.side == OrderSide.BUY
 
-        # Test balance operations
-        balance = await instance.fetch_balance("USDT")
         assert balance.currency == "USDT"
         assert balance.free == Decimal("10000")
 
@@ -423,9 +479,9 @@ class TestExchangePlugin(ExchangeBase):
         await instance.close()
         assert not instance._initialized
 
-    def test_plugin_validation_errors(self, temp_plugin_dir):
+    def test_plugin_validation_errors(self, preloaded_registry):
         """Test plugin validation error handling."""
-        registry = ExchangePluginRegistry(temp_plugin_dir)
+        registry = preloaded_registry
 
         # Test with invalid plugin class
         class InvalidPlugin(ExchangeBase):
@@ -435,10 +491,25 @@ class TestExchangePlugin(ExchangeBase):
         with pytest.raises(PluginValidationError):
             registry._validate_plugin(InvalidPlugin)
 
-    def test_plugin_not_found_errors(self, temp_plugin_dir):
+    @pytest.mark.parametrize(
+        "plugin_class,match",
+        [
+            (_AbstractPlugin, "is abstract"),
+            (_PartialPlugin, "is abstract"),
+            (_NotAnExchange, "not an ExchangeBase subclass"),
+        ],
+        ids=["abstract", "partial", "not_exchange_base"],
+    )
+    def test_plugin_validation_rejects_invalid_shapes(
+        self, preloaded_registry, plugin_class, match
+    ):
+        """Test that each kind of invalid plugin is rejected with a clear reason."""
+        with pytest.raises(PluginValidationError, match=match):
+            preloaded_registry._validate_plugin(plugin_class)
+
+    def test_plugin_not_found_errors(self, preloaded_registry):
         """Test plugin not found error handling."""
-        registry = ExchangePluginRegistry(temp_plugin_dir)
-        registry.load_plugins()
+        registry = preloaded_registry
 
         # Test getting non-existent plugin
         with pytest.raises(PluginNotFound):
@@ -463,10 +534,9 @@ class TestExchangePlugin(ExchangeBase):
         assert len(registry._plugins) == initial_count
         assert registry._loaded
 
-    def test_plugin_unloading(self, temp_plugin_dir):
+    def test_plugin_unloading(self, fresh_registry):
         """Test plugin unloading functionality."""
-        registry = ExchangePluginRegistry(temp_plugin_dir)
-        registry.load_plugins()
+        registry = fresh_registry
 
         # Create an instance
         instance = registry.get_exchange("test_exchange")
@@ -479,10 +549,9 @@ class TestExchangePlugin(ExchangeBase):
         assert "test_exchange" not in registry._plugins
         assert "test_exchange" not in registry._instances
 
-    def test_multiple_plugin_instances(self, temp_plugin_dir):
+    def test_multiple_plugin_instances(self, fresh_registry):
         """Test creating multiple instances of the same plugin."""
-        registry = ExchangePluginRegistry(temp_plugin_dir)
-        registry.load_plugins()
+        registry = fresh_registry
 
         # Create multiple instances
         instance1 = registry.get_exchange("test_exchange", api_key="key1")
@@ -496,10 +565,9 @@ class TestExchangePlugin(ExchangeBase):
         # Verify both are tracked
         assert len(registry._instances) == 2
 
-    def test_plugin_precision_methods(self, temp_plugin_dir):
+    def test_plugin_precision_methods(self, preloaded_registry):
         """Test plugin precision methods."""
-        registry = ExchangePluginRegistry(temp_plugin_dir)
-        registry.load_plugins()
+        registry = preloaded_registry
 
         instance = registry.get_exchange("test_exchange")
 
@@ -509,10 +577,9 @@ class TestExchangePlugin(ExchangeBase):
         assert instance.cost_to_precision("BTC/USDT", 1000.456) == "1000.456"
         assert instance.currency_to_precision("USDT", 1000.789) == "1000.789"
 
-    def test_plugin_string_representation(self, temp_plugin_dir):
+    def test_plugin_string_representation(self, preloaded_registry):
         """Test plugin string representation."""
-        registry = ExchangePluginRegistry(temp_plugin_dir)
-        registry.load_plugins()
+        registry = preloaded_registry
 
         instance = registry.get_exchange("test_exchange")
 
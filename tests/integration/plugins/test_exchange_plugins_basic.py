@@ -6,6 +6,8 @@ and configured correctly. They don't require actual API credentials
 or network access.
 """
 
+from dataclasses import dataclass
+
 import pytest
 
 from crypto_bot.plugins.exchanges.binance_plugin import BinancePlugin
@@ -13,31 +15,89 @@ from crypto_bot.plugins.exchanges.coinbase_pro_plugin import CoinbaseProPlugin
 from crypto_bot.plugins.exchanges.config_models import BinanceConfig, CoinbaseProConfig
 
 
-class TestBinancePluginBasic:
-    """Basic tests for Binance plugin."""
-
-    def test_instantiate_with_default_config(self) -> None:
-        """Test that Binance plugin can be instantiated with default config."""
-        config = BinanceConfig()
-        plugin = BinancePlugin(config)
-
-        assert plugin.name == "Binance"
-        assert plugin.id == "binance"
+@dataclass(frozen=True)
+class _PluginCase:
+    """Plugin under test together with its expected metadata."""
+
+    config_cls: type[BinanceConfig] | type[CoinbaseProConfig]
+    plugin_cls: type[BinancePlugin] | type[CoinbaseProPlugin]
+    name: str
+    id: str
+    capabilities: tuple[str, ...]
+
+
+_COMMON_CAPABILITIES = (
+    "createOrder",
+    "cancelOrder",
+    "fetchBalance",
+    "fetchTicker",
+    "fetchOrderBook",
+)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        _PluginCase(
+            BinanceConfig,
+            BinancePlugin,
+            "Binance",
+            "binance",
+            (*_COMMON_CAPABILITIES, "fetchOHLCV"),
+        ),
+        _PluginCase(
+            CoinbaseProConfig,
+            CoinbaseProPlugin,
+            "Coinbase Pro",
+            "coinbasepro",
+            _COMMON_CAPABILITIES,
+        ),
+    ],
+    ids=["binance", "coinbasepro"],
+)
+def plugin_case(request: pytest.FixtureRequest) -> _PluginCase:
+    """Parametrize tests over the bundled exchange plugins."""
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def plugin(
+    plugin_case: _PluginCase,
+) -> BinancePlugin | CoinbaseProPlugin:
+    """Default-config plugin shared by read-only tests."""
+    return plugin_case.plugin_cls(plugin_case.config_cls())
+
+
+@pytest.fixture(scope="module")
+def sandbox_plugin(
+    plugin_case: _PluginCase,
+) -> BinancePlugin | CoinbaseProPlugin:
+    """Sandbox-config plugin shared by read-only tests."""
+    return plugin_case.plugin_cls(plugin_case.config_cls(sandbox=True))
+
+
+class TestExchangePluginBasic:
+    """Basic tests shared by the Binance and Coinbase Pro plugins."""
+
+    def test_instantiate_with_default_config(
+        self, plugin_case: _PluginCase, plugin: BinancePlugin | CoinbaseProPlugin
+    ) -> None:
+        """Test that the plugin can be instantiated with default config."""
+        assert plugin.name == plugin_case.name
+        assert plugin.id == plugin_case.id
         assert plugin.certified is True
         assert not plugin._initialized
 
-    def test_sandbox_flag_in_config(self) -> None:
+    def test_sandbox_flag_in_config(
+        self, sandbox_plugin: BinancePlugin | CoinbaseProPlugin
+    ) -> None:
         """Test that sandbox flag is properly configured."""
-        config = BinanceConfig(sandbox=True)
-        plugin = BinancePlugin(config)
+        assert sandbox_plugin.sandbox is True
 
-        assert plugin.sandbox is True
-
-    def test_properties_before_initialization(self) -> None:
+    def test_properties_before_initialization(
+        self, plugin: BinancePlugin | CoinbaseProPlugin
+    ) -> None:
         """Test that properties can be accessed before initialization."""
-        config = BinanceConfig()
-        plugin = BinancePlugin(config)
-
         assert isinstance(plugin.name, str)
         assert isinstance(plugin.id, str)
         assert isinstance(plugin.countries, list)
@@ -46,74 +106,17 @@ class TestBinancePluginBasic:
         assert isinstance(plugin.certified, bool)
         assert isinstance(plugin.has, dict)
 
-    def test_has_required_capabilities(self) -> None:
+    def test_has_required_capabilities(
+        self, plugin_case: _PluginCase, plugin: BinancePlugin | CoinbaseProPlugin
+    ) -> None:
         """Test that plugin has required capabilities."""
-        config = BinanceConfig()
-        plugin = BinancePlugin(config)
-
-        required_capabilities = [
-            "createOrder",
-            "cancelOrder",
-            "fetchBalance",
-            "fetchTicker",
-            "fetchOrderBook",
-            "fetchOHLCV",
-        ]
-
-        for capability in required_capabilities:
+        for capability in plugin_case.capabilities:
             assert capability in plugin.has
             assert plugin.has[capability] is True
 
 
 class TestCoinbaseProPluginBasic:
-    """Basic tests for Coinbase Pro plugin."""
-
-    def test_instantiate_with_default_config(self) -> None:
-        """Test that Coinbase Pro plugin can be instantiated with default config."""
-        config = CoinbaseProConfig()
-        plugin = CoinbaseProPlugin(config)
-
-        assert plugin.name == "Coinbase Pro"
-        assert plugin.id == "coinbasepro"
-        assert plugin.certified is True
-        assert not plugin._initialized
-
-    def test_sandbox_flag_in_config(self) -> None:
-        """Test that sandbox flag is properly configured."""
-        config = CoinbaseProConfig(sandbox=True)
-        plugin = CoinbaseProPlugin(config)
-
-        assert plugin.sandbox is True
-
-    def test_properties_before_initialization(self) -> None:
-        """Test that properties can be accessed before initialization."""
-        config = CoinbaseProConfig()
-        plugin = CoinbaseProPlugin(config)
-
-        assert isinstance(plugin.name, str)
-        assert isinstance(plugin.id, str)
-        assert isinstance(plugin.countries, list)
-        assert isinstance(plugin.urls, dict)
-        assert isinstance(plugin.version, str)
-        assert isinstance(plugin.certified, bool)
-        assert isinstance(plugin.has, dict)
-
-    def test_has_required_capabilities(self) -> None:
-        """Test that plugin has required capabilities."""
-        config = CoinbaseProConfig()
-        plugin = CoinbaseProPlugin(config)
-
-        required_capabilities = [
-            "createOrder",
-            "cancelOrder",
-            "fetchBalance",
-            "fetchTicker",
-            "fetchOrderBook",
-        ]
-
-        for capability in required_capabilities:
-            assert capability in plugin.has
-            assert plugin.has[capability] is True
+    """Coinbase Pro specific checks."""
 
     def test_positions_not_supported(self) -> None:
         """Test that Coinbase Pro correctly indicates no futures support."""
@@ -123,7 +126,6 @@ class TestCoinbaseProPluginBasic:
         assert plugin.has.get("fetchPositions") is False
 
 
-@pytest.mark.asyncio
 class TestPluginLifecycle:
     """Test plugin lifecycle management."""
 
@@ -1,23 +1,41 @@
 """
-Integration tests for exchange plugins using real testnet environments.
+Integration tests for exchange plugins against testnet-shaped HTTP endpoints.
 
-These tests require testnet API credentials and will be skipped if not available.
-Use environment variables or test configuration to provide credentials:
+By default every test runs against an in-process stub server preloaded with
+canned exchange responses from ``fixtures/<exchange>/*.json``, so the suite is
+fast and runs without credentials. The same tests also run against the real
+testnets under the ``live`` marker when credentials are available:
 - BINANCE_TESTNET_API_KEY
 - BINANCE_TESTNET_API_SECRET
 - COINBASE_TESTNET_API_KEY
 - COINBASE_TESTNET_API_SECRET
 - COINBASE_TESTNET_PASSPHRASE
 
-Mark tests with @pytest.mark.integration to run separately from unit tests.
+Deselect the live variants with ``-m "not live"``. The tests are independent
+and can be spread over pytest-xdist workers with ``-n auto --dist loadgroup``;
+the order round-trips stay together on one worker via ``xdist_group``.
 """
 
+import asyncio
+import itertools
+import json
 import os
+import re
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
 from decimal import Decimal
-from unittest.mock import patch
+from pathlib import Path
+from typing import Any, Callable, Dict, List, TypeVar
+from urllib.parse import urlsplit
 
+import ccxt.async_support as ccxt
 import pytest
 import pytest_asyncio
+from ccxt.base.errors import ExchangeError as CCXTExchangeError
+from ccxt.base.errors import RateLimitExceeded
+from pytest_httpserver import HTTPServer
 
 from crypto_bot.application.dtos.order import (
     CreateOrderRequest,
@@ -25,327 +43,417 @@ from crypto_bot.application.dtos.order import (
     OrderType,
 )
 from crypto_bot.application.exceptions import ExchangeError
+from crypto_bot.plugins.exchanges.base_ccxt_plugin import CCXTExchangePlugin
 from crypto_bot.plugins.exchanges.binance_plugin import BinancePlugin
 from crypto_bot.plugins.exchanges.coinbase_pro_plugin import CoinbaseProPlugin
-from crypto_bot.plugins.exchanges.config_models import BinanceConfig, CoinbaseProConfig
+from crypto_bot.plugins.exchanges.config_models import (
+    BinanceConfig,
+    CoinbaseProConfig,
+    ExchangeConfig,
+)
 
 # Check for testnet credentials
-BINANCE_TESTNET_AVAILABLE = bool(
-    os.getenv("BINANCE_TESTNET_API_KEY") and os.getenv("BINANCE_TESTNET_API_SECRET")
-)
+_BINANCE_KEY = os.getenv("BINANCE_TESTNET_API_KEY", "")
+_BINANCE_SECRET = os.getenv("BINANCE_TESTNET_API_SECRET", "")
+_COINBASE_KEY = os.getenv("COINBASE_TESTNET_API_KEY", "")
+_COINBASE_SECRET = os.getenv("COINBASE_TESTNET_API_SECRET", "")
+_COINBASE_PASSPHRASE = os.getenv("COINBASE_TESTNET_PASSPHRASE", "")
+
+BINANCE_TESTNET_AVAILABLE = bool(_BINANCE_KEY and _BINANCE_SECRET)
 
 COINBASE_TESTNET_AVAILABLE = bool(
-    os.getenv("COINBASE_TESTNET_API_KEY")
-    and os.getenv("COINBASE_TESTNET_API_SECRET")
-    and os.getenv("COINBASE_TESTNET_PASSPHRASE")
+    _COINBASE_KEY and _COINBASE_SECRET and _COINBASE_PASSPHRASE
 )
 
-
-@pytest.fixture
-def binance_testnet_config() -> BinanceConfig:
-    """Create Binance testnet configuration."""
-    return BinanceConfig(
-        api_key=os.getenv("BINANCE_TESTNET_API_KEY", ""),
-        api_secret=os.getenv("BINANCE_TESTNET_API_SECRET", ""),
-        sandbox=True,  # Enable testnet mode
+# Milliseconds between requests against the local stub
+_STUB_RATE_LIMIT_MS = 50
+
+# Configurations per backend, validated once at import
+_BINANCE_CONFIGS: Dict[str, ExchangeConfig] = {
+    # Short enough to keep the stub run fast, long enough that the burst test
+    # can tell a throttled burst from an unthrottled one
+    "stub": BinanceConfig(
+        api_key="stub_key",
+        secret="stub_secret",
+        sandbox=True,
+        rate_limit=_STUB_RATE_LIMIT_MS,
+    ),
+}
+if BINANCE_TESTNET_AVAILABLE:
+    _BINANCE_CONFIGS["live"] = BinanceConfig(
+        api_key=_BINANCE_KEY, secret=_BINANCE_SECRET, sandbox=True
     )
 
-
-@pytest.fixture
-def coinbase_testnet_config() -> CoinbaseProConfig:
-    """Create Coinbase Pro testnet configuration."""
-    return CoinbaseProConfig(
-        api_key=os.getenv("COINBASE_TESTNET_API_KEY", ""),
-        api_secret=os.getenv("COINBASE_TESTNET_API_SECRET", ""),
-        passphrase=os.getenv("COINBASE_TESTNET_PASSPHRASE", ""),
-        sandbox=True,  # Enable testnet mode
+_COINBASE_CONFIGS: Dict[str, ExchangeConfig] = {
+    # The plugin pins sandbox mode to the retired Coinbase Pro host, so the
+    # stub is reached through the production URLs instead
+    "stub": CoinbaseProConfig(
+        api_key="stub_key",
+        secret="stub_secret",
+        password="stub_passphrase",
+        sandbox=False,
+        rate_limit=_STUB_RATE_LIMIT_MS,
+    ),
+}
+if COINBASE_TESTNET_AVAILABLE:
+    _COINBASE_CONFIGS["live"] = CoinbaseProConfig(
+        api_key=_COINBASE_KEY,
+        secret=_COINBASE_SECRET,
+        password=_COINBASE_PASSPHRASE,
+        sandbox=True,
     )
 
+STUB_FIXTURES = Path(__file__).parent / "fixtures"
+
+# The plugins surface CCXT errors unchanged, so accept either hierarchy
+EXCHANGE_ERRORS = (ExchangeError, CCXTExchangeError)
+
+# Order round-trips use a price unlikely to fill
+_PX_LOW = Decimal("1000")
+
+PluginT = TypeVar("PluginT", bound=CCXTExchangePlugin)
+
+# Every test shares its class's event loop with the class-scoped plugins
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope="class")]
+
+# Concurrent requests fired by the rate limit tests
+RATE_LIMIT_BURST = 5
+
+
+@dataclass(frozen=True)
+class _TestnetCase:
+    """Exchange plugin under test together with its testnet specifics."""
+
+    id: str
+    name: str
+    plugin_cls: type[BinancePlugin] | type[CoinbaseProPlugin]
+    ccxt_id: str
+    configs: Dict[str, ExchangeConfig]
+    symbol: str
+    order_quantity: Decimal
+    # Acceptable reasons for the testnet to reject the order round-trip
+    order_error_re: re.Pattern[str]
+    invalid_credentials: Dict[str, str]
+    # The sandbox may list no markets and lack data for common symbols
+    sparse_market_data: bool = False
+
+
+_TESTNET_CASES = (
+    _TestnetCase(
+        id="binance",
+        name="Binance",
+        plugin_cls=BinancePlugin,
+        ccxt_id="binance",
+        configs=_BINANCE_CONFIGS,
+        symbol="BTC/USDT",
+        order_quantity=Decimal("0.0001"),
+        order_error_re=re.compile(r"insufficient|balance|price", re.IGNORECASE),
+        invalid_credentials={"api_key": "invalid_key", "secret": "invalid_secret"},
+    ),
+    _TestnetCase(
+        id="coinbasepro",
+        name="Coinbase Pro",
+        plugin_cls=CoinbaseProPlugin,
+        ccxt_id="coinbase",
+        configs=_COINBASE_CONFIGS,
+        symbol="BTC/USD",
+        order_quantity=Decimal("0.001"),
+        order_error_re=re.compile(r"insufficient|balance|price|invalid", re.IGNORECASE),
+        invalid_credentials={
+            "api_key": "invalid_key",
+            "secret": "invalid_secret",
+            "password": "invalid_passphrase",
+        },
+        sparse_market_data=True,
+    ),
+)
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-class TestBinanceTestnetIntegration:
-    """Integration tests for Binance plugin on testnet."""
-
-    @pytest.mark.skipif(
-        not BINANCE_TESTNET_AVAILABLE,
-        reason="Binance testnet credentials not available",
+# Each exchange runs against the stub, and against the live testnet when
+# credentials are set
+_TESTNET_PARAMS = [
+    param
+    for case in _TESTNET_CASES
+    for param in (
+        pytest.param((case, "stub"), id=f"{case.id}-stub"),
+        pytest.param(
+            (case, "live"),
+            id=f"{case.id}-live",
+            marks=[
+                pytest.mark.live,
+                pytest.mark.skipif(
+                    "live" not in case.configs,
+                    reason=f"{case.name} testnet credentials not available",
+                ),
+            ],
+        ),
     )
-    async def test_initialize_binance_testnet(
-        self, binance_testnet_config: BinanceConfig
-    ) -> None:
-        """Test initializing Binance plugin with testnet."""
-        plugin = BinancePlugin(binance_testnet_config)
-        assert not plugin._initialized
-
-        await plugin.initialize()
-        assert plugin._initialized
-        assert plugin.sandbox is True
-
-        await plugin.close()
-
-    @pytest.mark.skipif(
-        not BINANCE_TESTNET_AVAILABLE,
-        reason="Binance testnet credentials not available",
+]
+
+
+def _load_stub_routes(exchange: str) -> List[Dict[str, Any]]:
+    """Load the canned routes for an exchange, header/query-specific ones first."""
+    routes = [
+        json.loads(path.read_text())
+        for path in sorted((STUB_FIXTURES / exchange).glob("*.json"))
+    ]
+    return sorted(routes, key=lambda r: "headers" not in r and "query" not in r)
+
+
+async def _burst_fetch_ticker(
+    plugin: CCXTExchangePlugin, symbol: str
+) -> tuple[list[Any], list[tuple[float, float]]]:
+    """Fire a burst of concurrent ticker requests, recording each throttle release."""
+    exchange = plugin._ccxt
+    throttle = exchange.throttle
+    released: list[tuple[float, float]] = []
+
+    async def _spy(cost: float | None = None) -> None:
+        await throttle(cost)
+        released.append((time.monotonic(), 1 if cost is None else cost))
+
+    exchange.throttle = _spy
+    try:
+        results = await asyncio.gather(
+            *[plugin.fetch_ticker(symbol) for _ in range(RATE_LIMIT_BURST)],
+            return_exceptions=True,
+        )
+    finally:
+        del exchange.throttle
+    return results, released
+
+
+def _assert_rate_limited_burst(
+    results: list[Any], released: list[tuple[float, float]], rate_limit_ms: int
+) -> None:
+    """Check a burst was either throttled client-side or rejected with 429s."""
+    errors = [r for r in results if isinstance(r, BaseException)]
+    # Anything other than a ticker must be the exchange pushing back
+    for error in errors:
+        assert isinstance(error, RateLimitExceeded) or "429" in str(error)
+    if not errors:
+        # Every request waited on CCXT's throttle, which lets the next one
+        # through only once the previous request's cost has been refilled.
+        # The throttle keeps whole-millisecond time, hence the slack.
+        assert len(released) >= RATE_LIMIT_BURST
+        for (prev_at, prev_cost), (at, _) in itertools.pairwise(released):
+            assert at - prev_at >= 0.9 * prev_cost * rate_limit_ms / 1000
+
+
+def _start_stub_server(exchange: str) -> HTTPServer:
+    """Start an HTTP server answering with the exchange's canned routes."""
+    server = HTTPServer()
+    for route in _load_stub_routes(exchange):
+        server.expect_request(
+            route["path"],
+            method=route["method"],
+            query_string=route.get("query"),
+            headers=route.get("headers"),
+        ).respond_with_json(route["json"], status=route.get("status", 200))
+    server.start()
+    return server
+
+
+def _rebase_urls(urls: Any, base_url: str) -> Any:
+    """Point every URL in a CCXT ``urls['api']`` tree at ``base_url``."""
+    if isinstance(urls, dict):
+        return {key: _rebase_urls(value, base_url) for key, value in urls.items()}
+    return base_url + urlsplit(urls).path
+
+
+def _stub_exchange_class(exchange_class: type, base_url: str) -> type:
+    """Subclass a CCXT exchange so both its live and sandbox URLs hit the stub."""
+
+    class StubExchange(exchange_class):  # type: ignore[misc, valid-type]
+        def describe(self) -> Dict[str, Any]:
+            spec = super().describe()
+            api = _rebase_urls(spec["urls"]["api"], base_url)
+            test = _rebase_urls(spec["urls"]["test"] or spec["urls"]["api"], base_url)
+            return self.deep_extend(spec, {"urls": {"api": api, "test": test}})
+
+    return StubExchange
+
+
+def _market_cached_class(exchange_class: type, cache: Dict[str, Any], key: str) -> type:
+    """Subclass a CCXT exchange so its markets are fetched once per session."""
+
+    class MarketCachedExchange(exchange_class):  # type: ignore[misc, valid-type]
+        async def load_markets(
+            self, reload: bool = False, params: Dict[str, Any] | None = None
+        ) -> Dict[str, Any]:
+            if not reload and key in cache:
+                return self.set_markets(*cache[key])
+            markets = await super().load_markets(reload, params or {})
+            cache[key] = (self.markets, self.currencies)
+            return markets
+
+    return MarketCachedExchange
+
+
+@pytest.fixture(scope="session")
+def markets_cache() -> Dict[str, Any]:
+    """Markets and currencies loaded so far, keyed by exchange and backend."""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def stub_servers() -> Iterator[Dict[str, HTTPServer]]:
+    """Canned-response servers per exchange, started on first use."""
+    servers: Dict[str, HTTPServer] = {}
+    yield servers
+    for server in servers.values():
+        server.stop()
+
+
+@pytest.fixture(scope="class", params=_TESTNET_PARAMS)
+def testnet_backend(
+    request: pytest.FixtureRequest,
+    markets_cache: Dict[str, Any],
+    stub_servers: Dict[str, HTTPServer],
+) -> tuple[_TestnetCase, str, type]:
+    """Pick the CCXT class routing an exchange's traffic to the stub or testnet."""
+    case, backend = request.param
+    exchange_class = getattr(ccxt, case.ccxt_id)
+    if backend == "stub":
+        if case.ccxt_id not in stub_servers:
+            stub_servers[case.ccxt_id] = _start_stub_server(case.ccxt_id)
+        exchange_class = _stub_exchange_class(
+            exchange_class, stub_servers[case.ccxt_id].url_for("").rstrip("/")
+        )
+    exchange_class = _market_cached_class(
+        exchange_class, markets_cache, f"{case.ccxt_id}-{backend}"
     )
-    async def test_fetch_markets_binance_testnet(
-        self, binance_testnet_config: BinanceConfig
-    ) -> None:
-        """Test fetching markets from Binance testnet."""
-        plugin = BinancePlugin(binance_testnet_config)
-        await plugin.initialize()
+    return case, backend, exchange_class
 
-        markets = await plugin.fetch_markets()
-        assert isinstance(markets, list)
-        assert len(markets) > 0
 
-        # Verify market structure
-        market = markets[0]
-        assert "id" in market or "symbol" in market
+@pytest.fixture(scope="class")
+def testnet_case(testnet_backend: tuple[_TestnetCase, str, type]) -> _TestnetCase:
+    """Exchange specifics for the current testnet parametrization."""
+    return testnet_backend[0]
 
-        await plugin.close()
 
-    @pytest.mark.skipif(
-        not BINANCE_TESTNET_AVAILABLE,
-        reason="Binance testnet credentials not available",
-    )
-    async def test_fetch_ticker_binance_testnet(
-        self, binance_testnet_config: BinanceConfig
-    ) -> None:
-        """Test fetching ticker from Binance testnet."""
-        plugin = BinancePlugin(binance_testnet_config)
-        await plugin.initialize()
-        await plugin.load_markets()
+@pytest.fixture(scope="class")
+def testnet_config(
+    testnet_backend: tuple[_TestnetCase, str, type],
+) -> ExchangeConfig:
+    """Create the testnet configuration for the current exchange and backend."""
+    case, backend, _ = testnet_backend
+    return case.configs[backend]
 
-        ticker = await plugin.fetch_ticker("BTC/USDT")
-        assert isinstance(ticker, dict)
-        assert "symbol" in ticker or "last" in ticker
 
-        await plugin.close()
+@pytest.fixture(scope="class")
+def make_plugin(
+    testnet_backend: tuple[_TestnetCase, str, type],
+) -> Callable[[ExchangeConfig], CCXTExchangePlugin]:
+    """Build plugins for the current backend with its CCXT class injected."""
+    case, _, exchange_class = testnet_backend
 
-    @pytest.mark.skipif(
-        not BINANCE_TESTNET_AVAILABLE,
-        reason="Binance testnet credentials not available",
-    )
-    async def test_fetch_ohlcv_binance_testnet(
-        self, binance_testnet_config: BinanceConfig
-    ) -> None:
-        """Test fetching OHLCV data from Binance testnet."""
-        plugin = BinancePlugin(binance_testnet_config)
-        await plugin.initialize()
-        await plugin.load_markets()
+    def _make_plugin(config: ExchangeConfig) -> CCXTExchangePlugin:
+        plugin = case.plugin_cls(config)  # type: ignore[arg-type]
+        plugin._exchange_class = exchange_class
+        return plugin
 
-        ohlcv = await plugin.fetch_ohlcv("BTC/USDT", timeframe="1h", limit=10)
-        assert isinstance(ohlcv, list)
-        if len(ohlcv) > 0:
-            # OHLCV format: [timestamp, open, high, low, close, volume]
-            assert len(ohlcv[0]) == 6
+    return _make_plugin
 
-        await plugin.close()
 
-    @pytest.mark.skipif(
-        not BINANCE_TESTNET_AVAILABLE,
-        reason="Binance testnet credentials not available",
-    )
-    async def test_fetch_balance_binance_testnet(
-        self, binance_testnet_config: BinanceConfig
-    ) -> None:
-        """Test fetching balance from Binance testnet."""
-        plugin = BinancePlugin(binance_testnet_config)
+@asynccontextmanager
+async def managed_plugin(plugin: PluginT) -> AsyncIterator[PluginT]:
+    """Initialize a plugin and close it on exit, even if the test failed."""
+    try:
         await plugin.initialize()
-
-        balance = await plugin.fetch_balance()
-        assert balance is not None
-        # Balance can be BalanceDTO or dict
-        if isinstance(balance, dict):
-            assert len(balance) >= 0  # May be empty on testnet
-        else:
-            assert hasattr(balance, "currency")
-
+        yield plugin
+    finally:
         await plugin.close()
 
-    @pytest.mark.skipif(
-        not BINANCE_TESTNET_AVAILABLE,
-        reason="Binance testnet credentials not available",
-    )
-    async def test_create_and_cancel_order_binance_testnet(
-        self, binance_testnet_config: BinanceConfig
-    ) -> None:
-        """Test creating and canceling order on Binance testnet."""
-        plugin = BinancePlugin(binance_testnet_config)
-        await plugin.initialize()
-        await plugin.load_markets()
 
-        # Create a limit buy order (will likely fail if insufficient balance, but tests the flow)
-        order_request = CreateOrderRequest(
-            exchange="binance",
-            symbol="BTC/USDT",
-            side=OrderSide.BUY,
-            type=OrderType.LIMIT,
-            quantity=Decimal("0.0001"),  # Very small amount
-            price=Decimal("1000"),  # Low price unlikely to fill
-        )
+@pytest_asyncio.fixture(loop_scope="class")
+async def plugin_stack() -> AsyncIterator[AsyncExitStack]:
+    """Exit stack that closes the plugins a test opened during teardown."""
+    async with AsyncExitStack() as stack:
+        yield stack
 
-        try:
-            order = await plugin.create_order(order_request)
-            assert order is not None
-            assert order.exchange_order_id is not None
 
-            # Cancel the order
-            canceled_order = await plugin.cancel_order(
-                order.exchange_order_id, "BTC/USDT"
-            )
-            assert canceled_order is not None
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def initialized_plugin(
+    make_plugin: Callable[[ExchangeConfig], CCXTExchangePlugin],
+    testnet_config: ExchangeConfig,
+) -> AsyncIterator[CCXTExchangePlugin]:
+    """Plugin initialized once per test class and backend, markets loaded."""
+    plugin = make_plugin(testnet_config)
+    async with managed_plugin(plugin) as initialized:
+        yield initialized
 
-        except Exception as e:
-            # Order creation may fail due to insufficient balance or other testnet issues
-            # This is acceptable - we're testing the integration, not the exchange itself
-            assert (
-                "insufficient" in str(e).lower()
-                or "balance" in str(e).lower()
-                or "price" in str(e).lower()
-            )
 
-        await plugin.close()
+class TestExchangeTestnetIntegration:
+    """Integration tests for the exchange plugins on their testnets."""
 
-    @pytest.mark.skipif(
-        not BINANCE_TESTNET_AVAILABLE,
-        reason="Binance testnet credentials not available",
-    )
-    async def test_rate_limit_handling_binance_testnet(
-        self, binance_testnet_config: BinanceConfig
+    async def test_initialize_testnet(
+        self,
+        make_plugin: Callable[[ExchangeConfig], CCXTExchangePlugin],
+        testnet_config: ExchangeConfig,
+        plugin_stack: AsyncExitStack,
     ) -> None:
-        """Test rate limit handling on Binance testnet."""
-        plugin = BinancePlugin(binance_testnet_config)
-        await plugin.initialize()
-        await plugin.load_markets()
-
-        # Make multiple rapid requests to test rate limiting
-        for _ in range(5):
-            try:
-                await plugin.fetch_ticker("BTC/USDT")
-            except Exception as e:
-                # Rate limit errors are acceptable
-                if "rate limit" in str(e).lower() or "429" in str(e):
-                    break
-
-        await plugin.close()
-
-    @pytest.mark.skipif(
-        not BINANCE_TESTNET_AVAILABLE,
-        reason="Binance testnet credentials not available",
-    )
-    async def test_error_handling_invalid_symbol_binance_testnet(
-        self, binance_testnet_config: BinanceConfig
-    ) -> None:
-        """Test error handling for invalid symbol on Binance testnet."""
-        plugin = BinancePlugin(binance_testnet_config)
-        await plugin.initialize()
-        await plugin.load_markets()
-
-        # Try to fetch ticker for invalid symbol
-        with pytest.raises(ExchangeError):  # Should raise exchange error
-            await plugin.fetch_ticker("INVALID/SYMBOL")
-
-        await plugin.close()
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-class TestCoinbaseProTestnetIntegration:
-    """Integration tests for Coinbase Pro plugin on testnet."""
-
-    @pytest.mark.skipif(
-        not COINBASE_TESTNET_AVAILABLE,
-        reason="Coinbase Pro testnet credentials not available",
-    )
-    async def test_initialize_coinbase_testnet(
-        self, coinbase_testnet_config: CoinbaseProConfig
-    ) -> None:
-        """Test initializing Coinbase Pro plugin with testnet."""
-        plugin = CoinbaseProPlugin(coinbase_testnet_config)
+        """Test initializing the plugin with testnet."""
+        plugin = make_plugin(testnet_config)
+        plugin_stack.push_async_callback(plugin.close)
         assert not plugin._initialized
 
         await plugin.initialize()
         assert plugin._initialized
-        assert plugin.sandbox is True
+        assert plugin.sandbox is testnet_config.sandbox
 
-        await plugin.close()
-
-    @pytest.mark.skipif(
-        not COINBASE_TESTNET_AVAILABLE,
-        reason="Coinbase Pro testnet credentials not available",
-    )
-    async def test_fetch_markets_coinbase_testnet(
-        self, coinbase_testnet_config: CoinbaseProConfig
+    async def test_fetch_markets_testnet(
+        self, testnet_case: _TestnetCase, initialized_plugin: CCXTExchangePlugin
     ) -> None:
-        """Test fetching markets from Coinbase Pro testnet."""
-        plugin = CoinbaseProPlugin(coinbase_testnet_config)
-        await plugin.initialize()
-
-        markets = await plugin.fetch_markets()
+        """Test fetching markets from testnet."""
+        markets = await initialized_plugin.fetch_markets()
         assert isinstance(markets, list)
-        # Coinbase may return empty list on testnet, which is acceptable
+        if testnet_case.sparse_market_data and not markets:
+            return
 
-        await plugin.close()
+        assert len(markets) > 0
+        # Verify market structure
+        market = markets[0]
+        assert "id" in market or "symbol" in market
 
-    @pytest.mark.skipif(
-        not COINBASE_TESTNET_AVAILABLE,
-        reason="Coinbase Pro testnet credentials not available",
-    )
-    async def test_fetch_ticker_coinbase_testnet(
-        self, coinbase_testnet_config: CoinbaseProConfig
+    async def test_fetch_ticker_testnet(
+        self, testnet_case: _TestnetCase, initialized_plugin: CCXTExchangePlugin
     ) -> None:
-        """Test fetching ticker from Coinbase Pro testnet."""
-        plugin = CoinbaseProPlugin(coinbase_testnet_config)
-        await plugin.initialize()
-        await plugin.load_markets()
-
+        """Test fetching ticker from testnet."""
         try:
-            ticker = await plugin.fetch_ticker("BTC/USD")
-            assert isinstance(ticker, dict)
+            ticker = await initialized_plugin.fetch_ticker(testnet_case.symbol)
         except Exception:
-            # Coinbase Pro testnet may have limited symbols
-            pass
+            if not testnet_case.sparse_market_data:
+                raise
+            # The sandbox may not list the symbol
+            return
 
-        await plugin.close()
+        assert isinstance(ticker, dict)
+        assert "symbol" in ticker or "last" in ticker
 
-    @pytest.mark.skipif(
-        not COINBASE_TESTNET_AVAILABLE,
-        reason="Coinbase Pro testnet credentials not available",
-    )
-    async def test_fetch_ohlcv_coinbase_testnet(
-        self, coinbase_testnet_config: CoinbaseProConfig
+    async def test_fetch_ohlcv_testnet(
+        self, testnet_case: _TestnetCase, initialized_plugin: CCXTExchangePlugin
     ) -> None:
-        """Test fetching OHLCV data from Coinbase Pro testnet."""
-        plugin = CoinbaseProPlugin(coinbase_testnet_config)
-        await plugin.initialize()
-        await plugin.load_markets()
-
+        """Test fetching OHLCV data from testnet."""
         try:
-            ohlcv = await plugin.fetch_ohlcv("BTC/USD", timeframe="1h", limit=10)
-            assert isinstance(ohlcv, list)
-            if len(ohlcv) > 0:
-                # OHLCV format: [timestamp, open, high, low, close, volume]
-                assert len(ohlcv[0]) == 6
+            ohlcv = await initialized_plugin.fetch_ohlcv(
+                testnet_case.symbol, timeframe="1h", limit=10
+            )
         except Exception:
-            # Coinbase Pro testnet may have limited symbols or data
-            pass
+            if not testnet_case.sparse_market_data:
+                raise
+            # The sandbox may have limited symbols or data
+            return
 
-        await plugin.close()
+        assert isinstance(ohlcv, list)
+        if len(ohlcv) > 0:
+            # OHLCV format: [timestamp, open, high, low, close, volume]
+            assert len(ohlcv[0]) == 6
 
-    @pytest.mark.skipif(
-        not COINBASE_TESTNET_AVAILABLE,
-        reason="Coinbase Pro testnet credentials not available",
-    )
-    async def test_fetch_balance_coinbase_testnet(
-        self, coinbase_testnet_config: CoinbaseProConfig
+    async def test_fetch_balance_testnet(
+        self, initialized_plugin: CCXTExchangePlugin
     ) -> None:
-        """Test fetching balance from Coinbase Pro testnet."""
-        plugin = CoinbaseProPlugin(coinbase_testnet_config)
-        await plugin.initialize()
-
-        balance = await plugin.fetch_balance()
+        """Test fetching balance from testnet."""
+        balance = await initialized_plugin.fetch_balance()
         assert balance is not None
         # Balance can be BalanceDTO or dict
         if isinstance(balance, dict):
@@ -353,28 +461,21 @@ class TestCoinbaseProTestnetIntegration:
         else:
             assert hasattr(balance, "currency")
 
-        await plugin.close()
-
-    @pytest.mark.skipif(
-        not COINBASE_TESTNET_AVAILABLE,
-        reason="Coinbase Pro testnet credentials not available",
-    )
-    async def test_create_and_cancel_order_coinbase_testnet(
-        self, coinbase_testnet_config: CoinbaseProConfig
+    @pytest.mark.xdist_group("testnet_orders")
+    async def test_create_and_cancel_order_testnet(
+        self, testnet_case: _TestnetCase, initialized_plugin: CCXTExchangePlugin
     ) -> None:
-        """Test creating and canceling order on Coinbase Pro testnet."""
-        plugin = CoinbaseProPlugin(coinbase_testnet_config)
-        await plugin.initialize()
-        await plugin.load_markets()
+        """Test creating and canceling order on testnet."""
+        plugin = initialized_plugin
 
         # Create a limit buy order (will likely fail if insufficient balance, but tests the flow)
         order_request = CreateOrderRequest(
-            exchange="coinbasepro",
-            symbol="BTC/USD",
+            exchange=testnet_case.id,
+            symbol=testnet_case.symbol,
             side=OrderSide.BUY,
             type=OrderType.LIMIT,
-            quantity=Decimal("0.001"),  # Very small amount
-            price=Decimal("1000"),  # Low price unlikely to fill
+            quantity=testnet_case.order_quantity,
+            price=_PX_LOW,
         )
 
         try:
@@ -384,88 +485,50 @@ class TestCoinbaseProTestnetIntegration:
 
             # Cancel the order
             canceled_order = await plugin.cancel_order(
-                order.exchange_order_id, "BTC/USD"
+                order.exchange_order_id, testnet_case.symbol
             )
             assert canceled_order is not None
 
         except Exception as e:
             # Order creation may fail due to insufficient balance or other testnet issues
             # This is acceptable - we're testing the integration, not the exchange itself
-            assert (
-                "insufficient" in str(e).lower()
-                or "balance" in str(e).lower()
-                or "price" in str(e).lower()
-                or "invalid" in str(e).lower()
-            )
+            assert testnet_case.order_error_re.search(str(e))
 
-        await plugin.close()
-
-    @pytest.mark.skipif(
-        not COINBASE_TESTNET_AVAILABLE,
-        reason="Coinbase Pro testnet credentials not available",
-    )
-    async def test_rate_limit_handling_coinbase_testnet(
-        self, coinbase_testnet_config: CoinbaseProConfig
+    async def test_rate_limit_handling_testnet(
+        self,
+        testnet_case: _TestnetCase,
+        testnet_config: ExchangeConfig,
+        initialized_plugin: CCXTExchangePlugin,
     ) -> None:
-        """Test rate limit handling on Coinbase Pro testnet."""
-        plugin = CoinbaseProPlugin(coinbase_testnet_config)
-        await plugin.initialize()
-        await plugin.load_markets()
-
-        # Make multiple rapid requests to test rate limiting
-        try:
-            for _ in range(5):
-                try:
-                    await plugin.fetch_ticker("BTC/USD")
-                except Exception as e:
-                    # Rate limit errors are acceptable
-                    if "rate limit" in str(e).lower() or "429" in str(e):
-                        break
-        except Exception:
-            # Coinbase Pro testnet may have limited symbols
-            pass
+        """Test rate limit handling on testnet."""
+        results, released = await _burst_fetch_ticker(
+            initialized_plugin, testnet_case.symbol
+        )
 
-        await plugin.close()
+        _assert_rate_limited_burst(results, released, testnet_config.rate_limit)
 
-    @pytest.mark.skipif(
-        not COINBASE_TESTNET_AVAILABLE,
-        reason="Coinbase Pro testnet credentials not available",
-    )
-    async def test_error_handling_invalid_symbol_coinbase_testnet(
-        self, coinbase_testnet_config: CoinbaseProConfig
+    async def test_error_handling_invalid_symbol_testnet(
+        self, initialized_plugin: CCXTExchangePlugin
     ) -> None:
-        """Test error handling for invalid symbol on Coinbase Pro testnet."""
-        plugin = CoinbaseProPlugin(coinbase_testnet_config)
-        await plugin.initialize()
-        await plugin.load_markets()
-
+        """Test error handling for invalid symbol on testnet."""
         # Try to fetch ticker for invalid symbol
-        try:
-            with pytest.raises(ExchangeError):  # Should raise exchange error
-                await plugin.fetch_ticker("INVALID/SYMBOL")
-        except ExchangeError:
-            # Some exchanges return empty data instead of raising, which is acceptable
-            pass
-
-        await plugin.close()
+        with pytest.raises(EXCHANGE_ERRORS):  # Should raise exchange error
+            await initialized_plugin.fetch_ticker("INVALID/SYMBOL")
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
 class TestExchangePluginErrorHandling:
     """Test error handling scenarios for exchange plugins."""
 
-    @pytest.mark.skipif(
-        not BINANCE_TESTNET_AVAILABLE,
-        reason="Binance testnet credentials not available",
-    )
     async def test_network_error_handling(
-        self, binance_testnet_config: BinanceConfig
+        self,
+        make_plugin: Callable[[ExchangeConfig], CCXTExchangePlugin],
+        testnet_config: ExchangeConfig,
+        plugin_stack: AsyncExitStack,
     ) -> None:
         """Test handling of network errors."""
-        plugin = BinancePlugin(binance_testnet_config)
-        await plugin.initialize()
-        await plugin.load_markets()
+        plugin = await plugin_stack.enter_async_context(
+            managed_plugin(make_plugin(testnet_config))
+        )
 
         # Test error handling with invalid symbol
         # This should trigger proper error handling in the plugin
@@ -476,49 +539,22 @@ class TestExchangePluginErrorHandling:
             # Expected - plugin should handle errors gracefully
             pass
 
-        await plugin.close()
-
-    @pytest.mark.skipif(
-        not BINANCE_TESTNET_AVAILABLE,
-        reason="Binance testnet credentials not available",
-    )
-    async def test_authentication_error_handling(self) -> None:
+    async def test_authentication_error_handling(
+        self,
+        testnet_case: _TestnetCase,
+        make_plugin: Callable[[ExchangeConfig], CCXTExchangePlugin],
+        testnet_config: ExchangeConfig,
+        plugin_stack: AsyncExitStack,
+    ) -> None:
         """Test handling of authentication errors."""
         # Create plugin with invalid credentials
-        invalid_config = BinanceConfig(
-            api_key="invalid_key",
-            api_secret="invalid_secret",
-            sandbox=True,
+        invalid_config = testnet_config.model_copy(
+            update=testnet_case.invalid_credentials
         )
-        plugin = BinancePlugin(invalid_config)
-
-        try:
-            await plugin.initialize()
-            # Try an authenticated operation
-            with pytest.raises(ExchangeError):
-                await plugin.fetch_balance()
-        finally:
-            await plugin.close()
-
-    @pytest.mark.skipif(
-        not COINBASE_TESTNET_AVAILABLE,
-        reason="Coinbase Pro testnet credentials not available",
-    )
-    async def test_coinbase_authentication_error_handling(self) -> None:
-        """Test handling of authentication errors for Coinbase Pro."""
-        # Create plugin with invalid credentials
-        invalid_config = CoinbaseProConfig(
-            api_key="invalid_key",
-            api_secret="invalid_secret",
-            password="invalid_passphrase",
-            sandbox=True,
+        plugin = await plugin_stack.enter_async_context(
+            managed_plugin(make_plugin(invalid_config))
         )
-        plugin = CoinbaseProPlugin(invalid_config)
 
-        try:
-            await plugin.initialize()
-            # Try an authenticated operation
-            with pytest.raises(ExchangeError):
-                await plugin.fetch_balance()
-        finally:
-            await plugin.close()
+        # Try an authenticated operation
+        with pytest.raises(EXCHANGE_ERRORS):
+            await plugin.fetch_balance()
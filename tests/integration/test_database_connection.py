@@ -2,13 +2,24 @@
 Integration tests for database connection.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
+
 import pytest
+import pytest_asyncio
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from crypto_bot.infrastructure.database import db_engine, get_db_session
 
 
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def close_db_engine(worker_database: None) -> AsyncIterator[None]:
+    """Dispose of the application engine these tests open before the loop ends."""
+    yield
+    await db_engine.close()
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_database_connection() -> None:
@@ -38,8 +49,6 @@ async def test_session_factory() -> None:
         result = await session.execute(text("SELECT 1"))
         assert result.scalar() == 1
 
-    await db_engine.close()
-
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -50,21 +59,35 @@ async def test_get_db_session_dependency() -> None:
         result = await session.execute(text("SELECT 1"))
         assert result.scalar() == 1
 
-    await db_engine.close()
-
 
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_multiple_sessions() -> None:
     """Test that multiple sessions can be created and used concurrently."""
-    sessions = []
+    session_count = 3
+    in_flight = 0
+    all_open = asyncio.Event()
+    peak_checked_out = 0
+    session_factory = db_engine.get_session_factory()
 
-    # Create multiple sessions
-    for _ in range(3):
-        async for session in get_db_session():
-            sessions.append(session)
+    async def _one() -> None:
+        nonlocal in_flight, peak_checked_out
+        async with session_factory() as session:
             result = await session.execute(text("SELECT 1"))
             assert result.scalar() == 1
 
-    assert len(sessions) == 3
-    await db_engine.close()
+            # Hold the connection until every session has checked one out
+            in_flight += 1
+            if in_flight == session_count:
+                all_open.set()
+            await asyncio.wait_for(all_open.wait(), timeout=5)
+            peak_checked_out = max(
+                peak_checked_out, db_engine.create_engine().pool.checkedout()
+            )
+
+    # A failing session cancels its siblings instead of leaving them waiting
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(session_count):
+            tg.create_task(_one())
+
+    assert peak_checked_out == session_count
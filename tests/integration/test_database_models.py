@@ -3,14 +3,16 @@ Integration tests for database models.
 """
 
 import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime
+from types import SimpleNamespace
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import inspect, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
-from crypto_bot.infrastructure.database import Base, db_engine
 from crypto_bot.infrastructure.database.models import (
     Asset,
     Exchange,
@@ -26,46 +28,65 @@ from crypto_bot.infrastructure.database.models import (
     TradingPair,
 )
 
+pytestmark = pytest.mark.asyncio
 
-@pytest_asyncio.fixture
-async def setup_database() -> None:
-    """Set up test database schema."""
-    engine = db_engine.create_engine()
 
+@pytest_asyncio.fixture(scope="module")
+async def setup_database(
+    create_schema: Callable[[], Awaitable[None]],
+    drop_schema: Callable[[], Awaitable[None]],
+) -> AsyncIterator[None]:
+    """Create the test database schema once for the module."""
     # Create all tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    await create_schema()
 
     yield
 
     # Drop all tables after tests
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    await drop_schema()
 
-    await db_engine.close()
 
-
-@pytest_asyncio.fixture
-async def db_session(setup_database: None) -> AsyncSession:
-    """Get database session for tests."""
-    session_factory = db_engine.get_session_factory()
+@pytest_asyncio.fixture(scope="module")
+async def seeded_entities(
+    session_factory: async_sessionmaker[AsyncSession], setup_database: None
+) -> SimpleNamespace:
+    """Seed the exchange, assets, trading pair and strategy shared by the tests."""
     async with session_factory() as session:
-        yield session
+        exchange = Exchange(name="binance", is_active=True)
+        btc = Asset(symbol="BTC", name="Bitcoin", is_active=True)
+        usdt = Asset(symbol="USDT", name="Tether", is_active=True)
+        strategy = Strategy(name="RSI Strategy", plugin_name="rsi_strategy")
+        session.add_all([exchange, btc, usdt, strategy])
+        await session.flush()
+
+        trading_pair = TradingPair(
+            base_asset_id=btc.id,
+            quote_asset_id=usdt.id,
+            exchange_id=exchange.id,
+            symbol="BTC/USDT",
+            min_order_size=0.001,
+            tick_size=0.01,
+        )
+        session.add(trading_pair)
+        await session.commit()
+
+        return SimpleNamespace(
+            exchange_id=exchange.id,
+            btc_id=btc.id,
+            usdt_id=usdt.id,
+            trading_pair_id=trading_pair.id,
+            strategy_id=strategy.id,
+        )
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_create_tables(setup_database: None) -> None:
+async def test_create_tables(engine: AsyncEngine, setup_database: None) -> None:
     """Test that all tables are created correctly."""
-    engine = db_engine.create_engine()
-
     async with engine.connect() as conn:
         # Check that tables exist
-        def get_table_names(connection):  # type: ignore
-            inspector = inspect(connection)
-            return inspector.get_table_names()
-
-        tables = await conn.run_sync(get_table_names)
+        tables = await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).get_table_names()
+        )
 
         expected_tables = [
             "asset",
@@ -82,71 +103,51 @@ async def test_create_tables(setup_database: None) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_create_exchange(db_session: AsyncSession) -> None:
     """Test creating an exchange record."""
     exchange = Exchange(
-        name="binance",
+        name="kraken",
         is_active=True,
         is_testnet=False,
         config_json={"rate_limit": 1200},
     )
 
     db_session.add(exchange)
-    await db_session.commit()
-    await db_session.refresh(exchange)
+    await db_session.flush()
 
     assert exchange.id is not None
-    assert exchange.name == "binance"
+    assert exchange.name == "kraken"
     assert exchange.is_active is True
     assert exchange.created_at is not None
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_create_asset(db_session: AsyncSession) -> None:
     """Test creating an asset record."""
     asset = Asset(
-        symbol="BTC",
-        name="Bitcoin",
+        symbol="ETH",
+        name="Ethereum",
         is_active=True,
-        metadata_json={"decimals": 8},
+        metadata_json={"decimals": 18},
     )
 
     db_session.add(asset)
-    await db_session.commit()
-    await db_session.refresh(asset)
+    await db_session.flush()
 
     assert asset.id is not None
-    assert asset.symbol == "BTC"
-    assert asset.name == "Bitcoin"
+    assert asset.symbol == "ETH"
+    assert asset.name == "Ethereum"
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_create_trading_pair_with_relationships(
-    db_session: AsyncSession,
+    db_session: AsyncSession, seeded_entities: SimpleNamespace
 ) -> None:
     """Test creating a trading pair with asset and exchange relationships."""
-    # Create exchange
-    exchange = Exchange(name="binance", is_active=True)
-    db_session.add(exchange)
-
-    # Create assets
-    btc = Asset(symbol="BTC", name="Bitcoin", is_active=True)
-    usdt = Asset(symbol="USDT", name="Tether", is_active=True)
-    db_session.add_all([btc, usdt])
-
-    await db_session.commit()
-    await db_session.refresh(exchange)
-    await db_session.refresh(btc)
-    await db_session.refresh(usdt)
-
-    # Create trading pair
     trading_pair = TradingPair(
-        base_asset_id=btc.id,
-        quote_asset_id=usdt.id,
-        exchange_id=exchange.id,
+        base_asset_id=seeded_entities.btc_id,
+        quote_asset_id=seeded_entities.usdt_id,
+        exchange_id=seeded_entities.exchange_id,
         symbol="BTC/USDT",
         min_order_size=0.001,
         tick_size=0.01,
@@ -154,8 +155,9 @@ async def test_create_trading_pair_with_relationships(
     )
 
     db_session.add(trading_pair)
-    await db_session.commit()
-    await db_session.refresh(trading_pair)
+    await db_session.flush()
+    # The seeded rows live outside this session, so load the relationships
+    await db_session.refresh(trading_pair, ["base_asset", "quote_asset", "exchange"])
 
     assert trading_pair.id is not None
     assert trading_pair.symbol == "BTC/USDT"
@@ -165,31 +167,14 @@ async def test_create_trading_pair_with_relationships(
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_create_order_with_trades(db_session: AsyncSession) -> None:
+async def test_create_order_with_trades(
+    db_session: AsyncSession, seeded_entities: SimpleNamespace
+) -> None:
     """Test creating an order with associated trades."""
-    # Setup: Create necessary relationships
-    exchange = Exchange(name="binance", is_active=True)
-    btc = Asset(symbol="BTC", name="Bitcoin", is_active=True)
-    usdt = Asset(symbol="USDT", name="Tether", is_active=True)
-    db_session.add_all([exchange, btc, usdt])
-    await db_session.commit()
-
-    trading_pair = TradingPair(
-        base_asset_id=btc.id,
-        quote_asset_id=usdt.id,
-        exchange_id=exchange.id,
-        symbol="BTC/USDT",
-        min_order_size=0.001,
-        tick_size=0.01,
-    )
-    db_session.add(trading_pair)
-    await db_session.commit()
-
     # Create order
     order = Order(
-        trading_pair_id=trading_pair.id,
-        exchange_id=exchange.id,
+        trading_pair_id=seeded_entities.trading_pair_id,
+        exchange_id=seeded_entities.exchange_id,
         exchange_order_id="EX123456",
         type=OrderType.LIMIT,
         side=OrderSide.BUY,
@@ -203,8 +188,7 @@ async def test_create_order_with_trades(db_session: AsyncSession) -> None:
     )
 
     db_session.add(order)
-    await db_session.commit()
-    await db_session.refresh(order)
+    await db_session.flush()
 
     # Create trade
     trade = Trade(
@@ -216,7 +200,7 @@ async def test_create_order_with_trades(db_session: AsyncSession) -> None:
     )
 
     db_session.add(trade)
-    await db_session.commit()
+    await db_session.flush()
 
     assert order.id is not None
     assert order.exchange_order_id == "EX123456"
@@ -232,33 +216,14 @@ async def test_create_order_with_trades(db_session: AsyncSession) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_create_position(db_session: AsyncSession) -> None:
+async def test_create_position(
+    db_session: AsyncSession, seeded_entities: SimpleNamespace
+) -> None:
     """Test creating a position."""
-    # Setup
-    exchange = Exchange(name="binance", is_active=True)
-    btc = Asset(symbol="BTC", name="Bitcoin", is_active=True)
-    usdt = Asset(symbol="USDT", name="Tether", is_active=True)
-    strategy = Strategy(name="RSI Strategy", plugin_name="rsi_strategy")
-    db_session.add_all([exchange, btc, usdt, strategy])
-    await db_session.commit()
-
-    trading_pair = TradingPair(
-        base_asset_id=btc.id,
-        quote_asset_id=usdt.id,
-        exchange_id=exchange.id,
-        symbol="BTC/USDT",
-        min_order_size=0.001,
-        tick_size=0.01,
-    )
-    db_session.add(trading_pair)
-    await db_session.commit()
-
-    # Create position
     position = Position(
-        trading_pair_id=trading_pair.id,
-        exchange_id=exchange.id,
-        strategy_id=strategy.id,
+        trading_pair_id=seeded_entities.trading_pair_id,
+        exchange_id=seeded_entities.exchange_id,
+        strategy_id=seeded_entities.strategy_id,
         side=PositionSide.LONG,
         status=PositionStatus.OPEN,
         quantity=0.1,
@@ -268,8 +233,8 @@ async def test_create_position(db_session: AsyncSession) -> None:
     )
 
     db_session.add(position)
-    await db_session.commit()
-    await db_session.refresh(position)
+    await db_session.flush()
+    await db_session.refresh(position, ["strategy"])
 
     assert position.id is not None
     assert position.side == PositionSide.LONG
@@ -279,45 +244,32 @@ async def test_create_position(db_session: AsyncSession) -> None:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
-async def test_cascade_delete(db_session: AsyncSession) -> None:
+async def test_cascade_delete(
+    db_session: AsyncSession, seeded_entities: SimpleNamespace
+) -> None:
     """Test that cascade delete works correctly."""
-    # Create exchange with trading pairs and orders
-    exchange = Exchange(name="binance", is_active=True)
-    btc = Asset(symbol="BTC", name="Bitcoin", is_active=True)
-    usdt = Asset(symbol="USDT", name="Tether", is_active=True)
-    db_session.add_all([exchange, btc, usdt])
-    await db_session.commit()
-
-    trading_pair = TradingPair(
-        base_asset_id=btc.id,
-        quote_asset_id=usdt.id,
-        exchange_id=exchange.id,
-        symbol="BTC/USDT",
-        min_order_size=0.001,
-        tick_size=0.01,
-    )
-    db_session.add(trading_pair)
-    await db_session.commit()
-
     order = Order(
-        trading_pair_id=trading_pair.id,
-        exchange_id=exchange.id,
+        trading_pair_id=seeded_entities.trading_pair_id,
+        exchange_id=seeded_entities.exchange_id,
         type=OrderType.MARKET,
         side=OrderSide.BUY,
         status=OrderStatus.PENDING,
         quantity=0.1,
     )
     db_session.add(order)
-    await db_session.commit()
+    await db_session.flush()
 
-    exchange_id = exchange.id
     order_id = order.id
 
-    # Delete exchange (should cascade to orders)
-    await db_session.delete(exchange)
-    await db_session.commit()
+    # Delete exchange (should cascade to orders); rolled back after the test
+    exchange_id = seeded_entities.exchange_id
+    result = await db_session.execute(
+        sa_delete(Exchange).where(Exchange.id == exchange_id).returning(Exchange.id)
+    )
+    assert result.scalar_one() == exchange_id
 
-    # Verify order was deleted
-    result = await db_session.execute(select(Order).where(Order.id == order_id))
-    assert result.scalar_one_or_none() is None
+    # Verify the foreign key cascade removed the order
+    remaining = await db_session.scalar(
+        select(func.count()).select_from(Order).where(Order.id == order_id)
+    )
+    assert remaining == 0
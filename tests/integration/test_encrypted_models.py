@@ -2,12 +2,13 @@
 Integration tests for encrypted database fields.
 """
 
+from collections.abc import Awaitable, Callable
+
 import pytest
 import pytest_asyncio
-from sqlalchemy import select, text
+from sqlalchemy import Text, insert, select, type_coerce
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from crypto_bot.infrastructure.database import Base, db_engine
 from crypto_bot.infrastructure.database.models import Exchange
 from crypto_bot.infrastructure.security.encryption import initialize_encryption_service
 
@@ -18,69 +19,60 @@ def setup_encryption() -> None:
     initialize_encryption_service("test_encryption_key_12345")
 
 
-@pytest_asyncio.fixture
-async def setup_database(setup_encryption: None) -> None:
-    """Set up test database schema."""
-    engine = db_engine.create_engine()
-
+@pytest_asyncio.fixture(scope="module")
+async def setup_database(
+    create_schema: Callable[[], Awaitable[None]],
+    drop_schema: Callable[[], Awaitable[None]],
+    setup_encryption: None,
+) -> None:
+    """Set up test database schema once for the module."""
     # Create all tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    await create_schema()
 
     yield
 
     # Drop all tables after tests
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
-    await db_engine.close()
-
-
-@pytest_asyncio.fixture
-async def db_session(setup_database: None) -> AsyncSession:
-    """Get database session for tests."""
-    session_factory = db_engine.get_session_factory()
-    async with session_factory() as session:
-        yield session
+    await drop_schema()
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_store_encrypted_credentials(db_session: AsyncSession) -> None:
     """Test that API credentials are encrypted when stored."""
-    # Create exchange with API credentials
-    exchange = Exchange(
-        name="binance_test",
-        api_key_encrypted="my_secret_api_key",
-        api_secret_encrypted="my_secret_api_secret",
-        is_active=True,
+    # Create exchange with API credentials; RETURNING hands back both the
+    # decrypted values and the stored bytes in the same round-trip
+    stored_key = type_coerce(Exchange.api_key_encrypted, Text).label("stored_key")
+    stored_secret = type_coerce(Exchange.api_secret_encrypted, Text).label(
+        "stored_secret"
     )
-
-    db_session.add(exchange)
-    await db_session.commit()
-    await db_session.refresh(exchange)
+    result = await db_session.execute(
+        insert(Exchange)
+        .values(
+            name="binance_test",
+            api_key_encrypted="my_secret_api_key",
+            api_secret_encrypted="my_secret_api_secret",
+            is_active=True,
+        )
+        .returning(
+            Exchange.api_key_encrypted,
+            Exchange.api_secret_encrypted,
+            stored_key,
+            stored_secret,
+        )
+    )
+    api_key, api_secret, raw_key, raw_secret = result.one()
 
     # In application code, credentials should be decrypted automatically
-    assert exchange.api_key_encrypted == "my_secret_api_key"
-    assert exchange.api_secret_encrypted == "my_secret_api_secret"
+    assert api_key == "my_secret_api_key"
+    assert api_secret == "my_secret_api_secret"
 
     # But in database, they should be encrypted (different from plaintext)
-    result = await db_session.execute(
-        text(
-            "SELECT api_key_encrypted, api_secret_encrypted "
-            "FROM exchange WHERE name = :name"
-        ),
-        {"name": "binance_test"},
-    )
-    row = result.fetchone()
-
-    # Database values should be encrypted (not equal to plaintext)
-    assert row[0] != "my_secret_api_key"
-    assert row[1] != "my_secret_api_secret"
+    assert raw_key != "my_secret_api_key"
+    assert raw_secret != "my_secret_api_secret"
 
     # And should not be empty
-    assert row[0] is not None
-    assert row[1] is not None
+    assert raw_key is not None
+    assert raw_secret is not None
 
 
 @pytest.mark.integration
@@ -99,20 +91,18 @@ async def test_retrieve_decrypted_credentials(db_session: AsyncSession) -> None:
 
     exchange_id = exchange.id
 
-    # Clear session to force database read
-    await db_session.close()
+    # Expire the identity map so the SELECT below reloads and decrypts the row
+    db_session.expire_all()
 
     # Retrieve exchange
-    session_factory = db_engine.get_session_factory()
-    async with session_factory() as new_session:
-        result = await new_session.execute(
-            select(Exchange).where(Exchange.id == exchange_id)
-        )
-        retrieved_exchange = result.scalar_one()
+    result = await db_session.execute(
+        select(Exchange).where(Exchange.id == exchange_id)
+    )
+    retrieved_exchange = result.scalar_one()
 
-        # Credentials should be automatically decrypted
-        assert retrieved_exchange.api_key_encrypted == "test_api_key"
-        assert retrieved_exchange.api_secret_encrypted == "test_api_secret"
+    # Credentials should be automatically decrypted
+    assert retrieved_exchange.api_key_encrypted == "test_api_key"
+    assert retrieved_exchange.api_secret_encrypted == "test_api_secret"
 
 
 @pytest.mark.integration
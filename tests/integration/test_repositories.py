@@ -4,21 +4,14 @@ Integration tests for repository implementations.
 Tests all repository CRUD operations, relationships, and event sourcing.
 """
 
-import os
-
-# Set test encryption key BEFORE importing any application modules
-os.environ["ENCRYPTION_KEY"] = "test_encryption_key_32_bytes_long!!"
-
-from datetime import UTC, datetime, timezone
+from datetime import UTC, datetime, timedelta, timezone
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
 
-from crypto_bot.application.services.event_service import EventService
-from crypto_bot.infrastructure.database import Base, get_db_session
-from crypto_bot.infrastructure.database.engine import db_engine
+from crypto_bot.application.services.event_service import EventService, EventSpec
 from crypto_bot.infrastructure.database.models import (
     Asset,
     Exchange,
@@ -44,31 +37,63 @@ from crypto_bot.infrastructure.database.repositories import (
     TradingPairRepository,
 )
 
+# Trading pair limits shared by the tests, parsed once at import
+BTC_USDT_SPEC = {
+    "symbol": "BTC/USDT",
+    "min_order_size": Decimal("0.001"),
+    "max_order_size": Decimal("1000.0"),
+    "tick_size": Decimal("0.01"),
+}
 
-@pytest_asyncio.fixture(scope="function")
-async def setup_database():
-    """Create all tables before each test and drop them after."""
-    # Reset engine to avoid event loop issues
-    await db_engine.close()
-    engine = db_engine.create_engine()
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+@pytest_asyncio.fixture(scope="module")
+async def setup_database(create_schema, drop_schema):
+    """Create all tables once for the module and drop them at the end."""
+    await create_schema()
     yield
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    await drop_schema()
+
+
+async def bulk_create(session, entities):
+    """Add several entities and insert them with a single flush."""
+    session.add_all(entities)
+    await session.flush()
+
 
-    # Clean up engine
-    await db_engine.close()
+async def copy_insert(session, table, rows):
+    """
+    Load rows into a table with PostgreSQL's binary COPY protocol.
+
+    COPY bypasses the ORM, so every row must supply each column that has
+    no server default. Rows are written inside the session's transaction.
+    """
+    conn = await session.connection()
+    raw_conn = await conn.get_raw_connection()
+    columns = list(rows[0])
+    await raw_conn.driver_connection.copy_records_to_table(
+        table.name,
+        records=[tuple(row[column] for column in columns) for row in rows],
+        columns=columns,
+        schema_name=table.schema,
+    )
 
 
 @pytest_asyncio.fixture
-async def db_session(setup_database):
-    """Provide an async database session for tests."""
-    async for session in get_db_session():
-        yield session
-        await session.rollback()
+async def btc_usdt_pair(db_session):
+    """Insert an exchange with a BTC/USDT trading pair and return the pair."""
+    exchange = Exchange(
+        name="binance", api_key_encrypted="key", api_secret_encrypted="secret"
+    )
+    btc = Asset(symbol="BTC", name="Bitcoin")
+    usdt = Asset(symbol="USDT", name="Tether")
+    pair = TradingPair(
+        exchange=exchange,
+        base_asset=btc,
+        quote_asset=usdt,
+        **BTC_USDT_SPEC,
+    )
+    await bulk_create(db_session, [exchange, btc, usdt, pair])
+    return pair
 
 
 @pytest_asyncio.fixture
@@ -129,7 +154,7 @@ class TestExchangeRepository:
     """Tests for ExchangeRepository."""
 
     @pytest.mark.asyncio
-    async def test_create_exchange(self, exchange_repo, db_session):
+    async def test_create_exchange(self, exchange_repo):
         """Test creating an exchange."""
         exchange = Exchange(
             name="binance",
@@ -141,7 +166,6 @@ class TestExchangeRepository:
         )
 
         created = await exchange_repo.create(exchange)
-        await db_session.commit()
 
         assert created.id is not None
         assert created.name == "binance"
@@ -149,7 +173,7 @@ class TestExchangeRepository:
         assert created.updated_at is not None
 
     @pytest.mark.asyncio
-    async def test_get_by_name(self, exchange_repo, db_session):
+    async def test_get_by_name(self, exchange_repo):
         """Test getting exchange by name."""
         exchange = Exchange(
             name="coinbase",
@@ -157,14 +181,13 @@ class TestExchangeRepository:
             api_secret_encrypted="test_secret",
         )
         await exchange_repo.create(exchange)
-        await db_session.commit()
 
         found = await exchange_repo.get_by_name("coinbase")
         assert found is not None
         assert found.name == "coinbase"
 
     @pytest.mark.asyncio
-    async def test_get_active_exchanges(self, exchange_repo, db_session):
+    async def test_get_active_exchanges(self, exchange_repo):
         """Test getting active exchanges."""
         active_exchange = Exchange(
             name="binance",
@@ -181,7 +204,6 @@ class TestExchangeRepository:
 
         await exchange_repo.create(active_exchange)
         await exchange_repo.create(inactive_exchange)
-        await db_session.commit()
 
         active_exchanges = await exchange_repo.get_active_exchanges()
         assert len(active_exchanges) == 1
@@ -192,23 +214,21 @@ class TestAssetRepository:
     """Tests for AssetRepository."""
 
     @pytest.mark.asyncio
-    async def test_create_asset(self, asset_repo, db_session):
+    async def test_create_asset(self, asset_repo):
         """Test creating an asset."""
         asset = Asset(symbol="BTC", name="Bitcoin", is_active=True)
 
         created = await asset_repo.create(asset)
-        await db_session.commit()
 
         assert created.id is not None
         assert created.symbol == "BTC"
         assert created.name == "Bitcoin"
 
     @pytest.mark.asyncio
-    async def test_get_by_symbol(self, asset_repo, db_session):
+    async def test_get_by_symbol(self, asset_repo):
         """Test getting asset by symbol."""
         asset = Asset(symbol="ETH", name="Ethereum")
         await asset_repo.create(asset)
-        await db_session.commit()
 
         found = await asset_repo.get_by_symbol("ETH")
         assert found is not None
@@ -221,10 +241,7 @@ class TestAssetRepository:
         eth = Asset(symbol="ETH", name="Ethereum")
         usdt = Asset(symbol="USDT", name="Tether USD")
 
-        await asset_repo.create(btc)
-        await asset_repo.create(eth)
-        await asset_repo.create(usdt)
-        await db_session.commit()
+        await bulk_create(db_session, [btc, eth, usdt])
 
         results = await asset_repo.search_by_name("ethereum")
         assert len(results) == 1
@@ -236,56 +253,75 @@ class TestOrderRepository:
 
     @pytest.mark.asyncio
     async def test_create_order_and_get_by_status(
-        self, order_repo, exchange_repo, trading_pair_repo, asset_repo, db_session
+        self, order_repo, btc_usdt_pair, db_session
     ):
         """Test creating an order and querying by status."""
-        # Create dependencies
-        exchange = Exchange(
-            name="binance", api_key_encrypted="key", api_secret_encrypted="secret"
-        )
-        await exchange_repo.create(exchange)
-
-        btc = Asset(symbol="BTC", name="Bitcoin")
-        usdt = Asset(symbol="USDT", name="Tether")
-        await asset_repo.create(btc)
-        await asset_repo.create(usdt)
-
-        pair = TradingPair(
-            exchange_id=exchange.id,
-            base_asset_id=btc.id,
-            quote_asset_id=usdt.id,
-            symbol="BTC/USDT",
-            min_order_size=Decimal("0.001"),
-            max_order_size=Decimal("1000.0"),
-            tick_size=Decimal("0.01"),
-        )
-        await trading_pair_repo.create(pair)
-
-        # Create order
         order = Order(
             exchange_order_id="12345",
-            exchange_id=exchange.id,
-            trading_pair_id=pair.id,
+            exchange_id=btc_usdt_pair.exchange_id,
+            trading_pair_id=btc_usdt_pair.id,
             type=OrderType.LIMIT,
             side=OrderSide.BUY,
             status=OrderStatus.PENDING,
             quantity=Decimal("1.5"),
             price=Decimal("50000.00"),
         )
-        created = await order_repo.create(order)
-        await db_session.commit()
+        await order_repo.create(order)
 
-        # Query by status
+        # Query by status; relationships must arrive without a lazy load
+        db_session.expire_all()
         pending_orders = await order_repo.get_by_status(OrderStatus.PENDING)
         assert len(pending_orders) == 1
-        assert pending_orders[0].id == created.id
+        assert pending_orders[0].id == order.id
+        assert pending_orders[0].trading_pair.symbol == "BTC/USDT"
+        assert pending_orders[0].exchange.name == "binance"
+
+
+class TestTradeRepository:
+    """Tests for TradeRepository."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_order_with_copied_trades(
+        self, order_repo, trade_repo, btc_usdt_pair, db_session
+    ):
+        """Test listing an order's trades seeded through COPY."""
+        order = await order_repo.create(
+            Order(
+                exchange_id=btc_usdt_pair.exchange_id,
+                trading_pair_id=btc_usdt_pair.id,
+                type=OrderType.MARKET,
+                side=OrderSide.BUY,
+                quantity=Decimal("25"),
+            )
+        )
+        started_at = datetime.now(UTC)
+        await copy_insert(
+            db_session,
+            Trade.__table__,
+            [
+                {
+                    "id": uuid4(),
+                    "order_id": order.id,
+                    "exchange_trade_id": f"trade_{i}",
+                    "price": Decimal("50000.00"),
+                    "quantity": Decimal("1"),
+                    "fee": Decimal("0"),
+                    "timestamp": started_at + timedelta(seconds=i),
+                }
+                for i in range(25)
+            ],
+        )
+
+        trades = await trade_repo.get_by_order(order.id)
+        assert len(trades) == 25
+        assert trades[0].exchange_trade_id == "trade_24"
 
 
 class TestEventSourcing:
     """Tests for event sourcing and EventService."""
 
     @pytest.mark.asyncio
-    async def test_emit_order_created_event(self, event_service, db_session):
+    async def test_emit_order_created_event(self, event_service):
         """Test emitting OrderCreated event."""
         order_id = uuid4()
         order_data = {
@@ -300,7 +336,6 @@ class TestEventSourcing:
             order_data=order_data,
             metadata={"user": "test_user"},
         )
-        await db_session.commit()
 
         assert event.event_id is not None
         assert event.event_type == "OrderCreated"
@@ -308,22 +343,25 @@ class TestEventSourcing:
         assert event.payload == order_data
 
     @pytest.mark.asyncio
-    async def test_replay_aggregate_events(self, event_service, db_session):
+    async def test_replay_aggregate_events(self, event_service):
         """Test replaying events to reconstruct aggregate state."""
         order_id = uuid4()
 
-        # Emit series of events
-        await event_service.emit_order_created(
-            order_id=order_id,
-            order_data={"type": "LIMIT", "side": "BUY", "quantity": "1.0"},
-        )
-        await event_service.emit_order_updated(
-            order_id=order_id, update_data={"status": "partially_filled"}
-        )
-        await event_service.emit_order_filled(
-            order_id=order_id, fill_data={"filled_quantity": "1.0"}
+        # Emit series of events in one batch
+        await event_service.emit_many(
+            [
+                EventSpec(
+                    "OrderCreated",
+                    order_id,
+                    "Order",
+                    {"type": "LIMIT", "side": "BUY", "quantity": "1.0"},
+                ),
+                EventSpec(
+                    "OrderUpdated", order_id, "Order", {"status": "partially_filled"}
+                ),
+                EventSpec("OrderFilled", order_id, "Order", {"filled_quantity": "1.0"}),
+            ]
         )
-        await db_session.commit()
 
         # Replay events
         state = await event_service.replay_aggregate(
@@ -341,42 +379,17 @@ class TestFullTradingFlow:
     @pytest.mark.asyncio
     async def test_complete_order_lifecycle(
         self,
-        exchange_repo,
-        asset_repo,
-        trading_pair_repo,
         order_repo,
         trade_repo,
         event_service,
-        db_session,
+        btc_usdt_pair,
     ):
         """Test complete order lifecycle with event sourcing."""
-        # Setup
-        exchange = Exchange(
-            name="test_exchange", api_key_encrypted="k", api_secret_encrypted="s"
-        )
-        await exchange_repo.create(exchange)
-
-        btc = Asset(symbol="BTC", name="Bitcoin")
-        usdt = Asset(symbol="USDT", name="Tether")
-        await asset_repo.create(btc)
-        await asset_repo.create(usdt)
-
-        pair = TradingPair(
-            exchange_id=exchange.id,
-            base_asset_id=btc.id,
-            quote_asset_id=usdt.id,
-            symbol="BTC/USDT",
-            min_order_size=Decimal("0.001"),
-            max_order_size=Decimal("1000.0"),
-            tick_size=Decimal("0.01"),
-        )
-        await trading_pair_repo.create(pair)
-
         # Create order
         order = Order(
             exchange_order_id="ord_123",
-            exchange_id=exchange.id,
-            trading_pair_id=pair.id,
+            exchange_id=btc_usdt_pair.exchange_id,
+            trading_pair_id=btc_usdt_pair.id,
             type=OrderType.LIMIT,
             side=OrderSide.BUY,
             status=OrderStatus.PENDING,
@@ -417,8 +430,6 @@ class TestFullTradingFlow:
             order_id=updated_order.id, fill_data={"filled_quantity": "1.0"}
         )
 
-        await db_session.commit()
-
         # Verify
         order_events = await event_service.get_aggregate_events(
             aggregate_id=created_order.id, aggregate_type="Order"
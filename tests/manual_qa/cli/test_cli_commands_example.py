@@ -8,6 +8,9 @@ after manual validation is complete.
 
 import pytest
 
+# Placeholders only: skip at collection so no loop or fixture is set up
+pytestmark = pytest.mark.skip(reason="placeholder - implement after manual validation")
+
 
 @pytest.mark.manual_qa
 @pytest.mark.qa_cli
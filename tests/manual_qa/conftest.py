@@ -5,30 +5,30 @@ This module provides fixtures and utilities specific to manual QA tests
 that were created from validated manual test scenarios.
 """
 
-import os
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Generator
 
 import pytest
 
-# Set test encryption key BEFORE importing any application modules
-os.environ["ENCRYPTION_KEY"] = "test_encryption_key_32_bytes_long!!"
 
-
-@pytest.fixture(scope="function")
-def manual_qa_env(monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.fixture(scope="session")
+def manual_qa_env() -> Generator[None, None, None]:
     """
     Setup environment for manual QA tests.
 
-    Args:
-        monkeypatch: Pytest monkeypatch fixture
-    """
-    # Ensure encryption key is set
-    monkeypatch.setenv("ENCRYPTION_KEY", "test_encryption_key_32_bytes_long!!")
-    monkeypatch.setenv("ENCRYPTION_SALT", "test_salt_16_bytes")
+    The values never change between tests, so they are set once per session
+    rather than patched per test, and restored when the session ends.
 
-    # Disable real API calls in tests (use mocks)
-    monkeypatch.setenv("BINANCE_SANDBOX", "true")
-    monkeypatch.setenv("COINBASE_SANDBOX", "true")
+    Yields:
+        None
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        # Ensure encryption key is set
+        mp.setenv("ENCRYPTION_KEY", "test_encryption_key_32_bytes_long!!")
+        mp.setenv("ENCRYPTION_SALT", "test_salt_16_bytes")
+        # Disable real API calls in tests (use mocks)
+        mp.setenv("BINANCE_SANDBOX", "true")
+        mp.setenv("COINBASE_SANDBOX", "true")
+        yield
 
 
 @pytest.fixture
@@ -6,9 +6,9 @@ Tests validation, initialization, and edge cases for all DTOs.
 
 from datetime import UTC, datetime
 from decimal import Decimal
+from typing import Any
 
 import pytest
-from faker import Faker
 
 from crypto_bot.application.dtos.order import (
     BalanceDTO,
@@ -22,13 +22,10 @@ from crypto_bot.application.dtos.order import (
     RetryPolicy,
 )
 
-
-@pytest.fixture
-def faker() -> Faker:
-    """Provide Faker instance."""
-    fake = Faker()
-    Faker.seed(42)
-    return fake
+# The tests never inspect these values, so fixed strings replace generated ones
+EXCHANGE = "binance"
+ORDER_ID = "00000000-0000-0000-0000-000000000001"
+EXCHANGE_ORDER_ID = "00000000-0000-0000-0000-000000000002"
 
 
 class TestRetryPolicy:
@@ -52,34 +49,31 @@ class TestRetryPolicy:
         assert policy.max_delay == 60.0
         assert policy.exponential_base == 3.0
 
-    def test_negative_max_attempts_raises_error(self) -> None:
-        """Test RetryPolicy validation with negative max_attempts."""
-        with pytest.raises(ValueError, match="max_attempts must be non-negative"):
-            RetryPolicy(max_attempts=-1)
-
-    def test_invalid_initial_delay_raises_error(self) -> None:
-        """Test RetryPolicy validation with invalid initial_delay."""
-        with pytest.raises(ValueError, match="initial_delay must be positive"):
-            RetryPolicy(initial_delay=0)
-
-    def test_invalid_max_delay_raises_error(self) -> None:
-        """Test RetryPolicy validation with invalid max_delay."""
-        with pytest.raises(ValueError, match="max_delay must be positive"):
-            RetryPolicy(max_delay=0)
-
-    def test_invalid_exponential_base_raises_error(self) -> None:
-        """Test RetryPolicy validation with invalid exponential_base."""
-        with pytest.raises(ValueError, match="exponential_base must be greater than 1"):
-            RetryPolicy(exponential_base=1.0)
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            ({"max_attempts": -1}, "max_attempts must be non-negative"),
+            ({"initial_delay": 0}, "initial_delay must be positive"),
+            ({"max_delay": 0}, "max_delay must be positive"),
+            ({"exponential_base": 1.0}, "exponential_base must be greater than 1"),
+        ],
+        ids=["max_attempts", "initial_delay", "max_delay", "exponential_base"],
+    )
+    def test_invalid_values_raise_error(
+        self, kwargs: dict[str, float], match: str
+    ) -> None:
+        """Test RetryPolicy validation rejects out-of-range values."""
+        with pytest.raises(ValueError, match=match):
+            RetryPolicy(**kwargs)
 
 
 class TestCreateOrderRequest:
     """Test suite for CreateOrderRequest."""
 
-    def test_market_order_creation(self, faker: Faker) -> None:
+    def test_market_order_creation(self) -> None:
         """Test creating market order request."""
         request = CreateOrderRequest(
-            exchange=faker.word(),
+            exchange=EXCHANGE,
             symbol="BTC/USDT",
             side=OrderSide.BUY,
             type=OrderType.MARKET,
@@ -88,10 +82,10 @@ class TestCreateOrderRequest:
         assert request.type == OrderType.MARKET
         assert request.price is None
 
-    def test_limit_order_creation(self, faker: Faker) -> None:
+    def test_limit_order_creation(self) -> None:
         """Test creating limit order request."""
         request = CreateOrderRequest(
-            exchange=faker.word(),
+            exchange=EXCHANGE,
             symbol="BTC/USDT",
             side=OrderSide.BUY,
             type=OrderType.LIMIT,
@@ -101,56 +95,48 @@ class TestCreateOrderRequest:
         assert request.type == OrderType.LIMIT
         assert request.price == Decimal("50000")
 
-    def test_limit_order_without_price_raises_error(self, faker: Faker) -> None:
+    def test_limit_order_without_price_raises_error(self) -> None:
         """Test limit order requires price."""
         with pytest.raises(ValueError, match="price is required for limit orders"):
             CreateOrderRequest(
-                exchange=faker.word(),
-                symbol="BTC/USDT",
-                side=OrderSide.BUY,
-                type=OrderType.LIMIT,
-                quantity=Decimal("0.1"),
-            )
-
-    def test_negative_quantity_raises_error(self, faker: Faker) -> None:
-        """Test CreateOrderRequest validation with negative quantity."""
-        with pytest.raises(ValueError, match="quantity must be positive"):
-            CreateOrderRequest(
-                exchange=faker.word(),
-                symbol="BTC/USDT",
-                side=OrderSide.BUY,
-                type=OrderType.MARKET,
-                quantity=Decimal("-0.1"),
-            )
-
-    def test_zero_quantity_raises_error(self, faker: Faker) -> None:
-        """Test CreateOrderRequest validation with zero quantity."""
-        with pytest.raises(ValueError, match="quantity must be positive"):
-            CreateOrderRequest(
-                exchange=faker.word(),
-                symbol="BTC/USDT",
-                side=OrderSide.BUY,
-                type=OrderType.MARKET,
-                quantity=Decimal("0"),
-            )
-
-    def test_negative_price_raises_error(self, faker: Faker) -> None:
-        """Test CreateOrderRequest validation with negative price."""
-        with pytest.raises(ValueError, match="price must be positive"):
-            CreateOrderRequest(
-                exchange=faker.word(),
+                exchange=EXCHANGE,
                 symbol="BTC/USDT",
                 side=OrderSide.BUY,
                 type=OrderType.LIMIT,
                 quantity=Decimal("0.1"),
-                price=Decimal("-50000"),
             )
 
-    def test_custom_retry_policy(self, faker: Faker) -> None:
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            ({"quantity": Decimal("-0.1")}, "quantity must be positive"),
+            ({"quantity": Decimal("0")}, "quantity must be positive"),
+            (
+                {"type": OrderType.LIMIT, "price": Decimal("-50000")},
+                "price must be positive",
+            ),
+        ],
+        ids=["negative_quantity", "zero_quantity", "negative_price"],
+    )
+    def test_invalid_values_raise_error(
+        self, kwargs: dict[str, Any], match: str
+    ) -> None:
+        """Test CreateOrderRequest validation rejects invalid amounts."""
+        fields: dict[str, Any] = {
+            "exchange": EXCHANGE,
+            "symbol": "BTC/USDT",
+            "side": OrderSide.BUY,
+            "type": OrderType.MARKET,
+            "quantity": Decimal("0.1"),
+        }
+        with pytest.raises(ValueError, match=match):
+            CreateOrderRequest(**{**fields, **kwargs})
+
+    def test_custom_retry_policy(self) -> None:
         """Test CreateOrderRequest with custom retry policy."""
         custom_policy = RetryPolicy(max_attempts=5, initial_delay=2.0)
         request = CreateOrderRequest(
-            exchange=faker.word(),
+            exchange=EXCHANGE,
             symbol="BTC/USDT",
             side=OrderSide.BUY,
             type=OrderType.MARKET,
@@ -164,40 +150,40 @@ class TestCreateOrderRequest:
 class TestCancelOrderRequest:
     """Test suite for CancelOrderRequest."""
 
-    def test_cancel_order_creation(self, faker: Faker) -> None:
+    def test_cancel_order_creation(self) -> None:
         """Test creating cancel order request."""
         request = CancelOrderRequest(
-            exchange=faker.word(),
-            order_id=faker.uuid4(),
+            exchange=EXCHANGE,
+            order_id=ORDER_ID,
             symbol="BTC/USDT",
         )
         assert request.order_id is not None
         assert request.symbol == "BTC/USDT"
 
-    def test_empty_order_id_raises_error(self, faker: Faker) -> None:
+    def test_empty_order_id_raises_error(self) -> None:
         """Test CancelOrderRequest validation with empty order_id."""
         with pytest.raises(ValueError, match="order_id cannot be empty"):
             CancelOrderRequest(
-                exchange=faker.word(),
+                exchange=EXCHANGE,
                 order_id="",
                 symbol="BTC/USDT",
             )
 
-    def test_negative_timeout_raises_error(self, faker: Faker) -> None:
+    def test_negative_timeout_raises_error(self) -> None:
         """Test CancelOrderRequest validation with negative timeout."""
         with pytest.raises(ValueError, match="timeout must be positive"):
             CancelOrderRequest(
-                exchange=faker.word(),
-                order_id=faker.uuid4(),
+                exchange=EXCHANGE,
+                order_id=ORDER_ID,
                 symbol="BTC/USDT",
                 timeout=-1.0,
             )
 
-    def test_cancel_order_without_symbol(self, faker: Faker) -> None:
+    def test_cancel_order_without_symbol(self) -> None:
         """Test cancel order request without symbol."""
         request = CancelOrderRequest(
-            exchange=faker.word(),
-            order_id=faker.uuid4(),
+            exchange=EXCHANGE,
+            order_id=ORDER_ID,
         )
         assert request.symbol is None
 
@@ -205,12 +191,12 @@ class TestCancelOrderRequest:
 class TestOrderDTO:
     """Test suite for OrderDTO."""
 
-    def test_order_dto_creation(self, faker: Faker) -> None:
+    def test_order_dto_creation(self) -> None:
         """Test creating OrderDTO."""
         order = OrderDTO(
-            id=faker.uuid4(),
-            exchange_order_id=faker.uuid4(),
-            exchange=faker.word(),
+            id=ORDER_ID,
+            exchange_order_id=EXCHANGE_ORDER_ID,
+            exchange=EXCHANGE,
             symbol="BTC/USDT",
             side=OrderSide.BUY,
             type=OrderType.MARKET,
@@ -230,12 +216,12 @@ class TestOrderDTO:
         assert order.type == OrderType.MARKET
         assert order.status == OrderStatus.OPEN
 
-    def test_order_dto_limit_order(self, faker: Faker) -> None:
+    def test_order_dto_limit_order(self) -> None:
         """Test OrderDTO with limit order."""
         order = OrderDTO(
-            id=faker.uuid4(),
-            exchange_order_id=faker.uuid4(),
-            exchange=faker.word(),
+            id=ORDER_ID,
+            exchange_order_id=EXCHANGE_ORDER_ID,
+            exchange=EXCHANGE,
             symbol="BTC/USDT",
             side=OrderSide.SELL,
             type=OrderType.LIMIT,
@@ -258,10 +244,10 @@ class TestOrderDTO:
 class TestOrderStatusDTO:
     """Test suite for OrderStatusDTO."""
 
-    def test_order_status_dto_creation(self, faker: Faker) -> None:
+    def test_order_status_dto_creation(self) -> None:
         """Test creating OrderStatusDTO."""
         status = OrderStatusDTO(
-            order_id=faker.uuid4(),
+            order_id=ORDER_ID,
             status=OrderStatus.CLOSED,
             filled_quantity=Decimal("0.1"),
             remaining_quantity=Decimal("0"),
@@ -272,10 +258,10 @@ class TestOrderStatusDTO:
         assert status.filled_quantity == Decimal("0.1")
         assert status.remaining_quantity == Decimal("0")
 
-    def test_order_status_partial_fill(self, faker: Faker) -> None:
+    def test_order_status_partial_fill(self) -> None:
         """Test OrderStatusDTO with partial fill."""
         status = OrderStatusDTO(
-            order_id=faker.uuid4(),
+            order_id=ORDER_ID,
             status=OrderStatus.OPEN,
             filled_quantity=Decimal("0.05"),
             remaining_quantity=Decimal("0.05"),
@@ -289,10 +275,10 @@ class TestOrderStatusDTO:
 class TestBalanceDTO:
     """Test suite for BalanceDTO."""
 
-    def test_balance_dto_creation(self, faker: Faker) -> None:
+    def test_balance_dto_creation(self) -> None:
         """Test creating BalanceDTO."""
         balance = BalanceDTO(
-            exchange=faker.word(),
+            exchange=EXCHANGE,
             currency="BTC",
             free=Decimal("1.0"),
             used=Decimal("0.1"),
@@ -304,58 +290,34 @@ class TestBalanceDTO:
         assert balance.used == Decimal("0.1")
         assert balance.total == Decimal("1.1")
 
-    def test_balance_dto_validation_negative_free(self, faker: Faker) -> None:
-        """Test BalanceDTO validation with negative free balance."""
-        with pytest.raises(ValueError, match="free balance cannot be negative"):
-            BalanceDTO(
-                exchange=faker.word(),
-                currency="BTC",
-                free=Decimal("-0.1"),
-                used=Decimal("0"),
-                total=Decimal("0"),
-                timestamp=datetime.now(UTC),
-            )
-
-    def test_balance_dto_validation_negative_used(self, faker: Faker) -> None:
-        """Test BalanceDTO validation with negative used balance."""
-        with pytest.raises(ValueError, match="used balance cannot be negative"):
-            BalanceDTO(
-                exchange=faker.word(),
-                currency="BTC",
-                free=Decimal("1.0"),
-                used=Decimal("-0.1"),
-                total=Decimal("1.0"),
-                timestamp=datetime.now(UTC),
-            )
-
-    def test_balance_dto_validation_total_mismatch(self, faker: Faker) -> None:
-        """Test BalanceDTO validation when total doesn't match free + used."""
-        with pytest.raises(ValueError, match="total must equal free \\+ used"):
-            BalanceDTO(
-                exchange=faker.word(),
-                currency="BTC",
-                free=Decimal("1.0"),
-                used=Decimal("0.1"),
-                total=Decimal("2.0"),  # Wrong total
-                timestamp=datetime.now(UTC),
-            )
-
-    def test_balance_dto_validation_negative_total(self, faker: Faker) -> None:
-        """Test BalanceDTO validation with negative total."""
-        with pytest.raises(ValueError, match="total balance cannot be negative"):
+    @pytest.mark.parametrize(
+        "free,used,total,match",
+        [
+            ("-0.1", "0", "0", "free balance cannot be negative"),
+            ("1.0", "-0.1", "1.0", "used balance cannot be negative"),
+            ("1.0", "0.1", "2.0", "total must equal free \\+ used"),
+            ("0", "0", "-0.1", "total balance cannot be negative"),
+        ],
+        ids=["negative_free", "negative_used", "total_mismatch", "negative_total"],
+    )
+    def test_balance_dto_validation(
+        self, free: str, used: str, total: str, match: str
+    ) -> None:
+        """Test BalanceDTO validation rejects inconsistent balances."""
+        with pytest.raises(ValueError, match=match):
             BalanceDTO(
-                exchange=faker.word(),
+                exchange=EXCHANGE,
                 currency="BTC",
-                free=Decimal("0"),
-                used=Decimal("0"),
-                total=Decimal("-0.1"),
+                free=Decimal(free),
+                used=Decimal(used),
+                total=Decimal(total),
                 timestamp=datetime.now(UTC),
             )
 
-    def test_balance_dto_zero_balance(self, faker: Faker) -> None:
+    def test_balance_dto_zero_balance(self) -> None:
         """Test BalanceDTO with zero balance."""
         balance = BalanceDTO(
-            exchange=faker.word(),
+            exchange=EXCHANGE,
             currency="BTC",
             free=Decimal("0"),
             used=Decimal("0"),
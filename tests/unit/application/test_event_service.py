@@ -13,18 +13,32 @@ import pytest
 import pytest_asyncio
 from freezegun import freeze_time
 
-from crypto_bot.application.services.event_service import EventService
+from crypto_bot.application.services.event_service import EventService, EventSpec
 from crypto_bot.domain.repositories.event_repository import (
     DomainEvent as DomainEventInterface,
 )
 from crypto_bot.domain.repositories.event_repository import IEventRepository
 
+# Fixed fields shared by the events the mocked repository hands back
+_FROZEN_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+_BASE_EVENT_FIELDS: dict[str, Any] = {
+    "event_id": uuid4(),
+    "occurred_at": _FROZEN_NOW,
+    "metadata": {},
+}
+
+
+def _event(**fields: Any) -> DomainEventInterface:
+    """Build a domain event from the shared base fields plus ``fields``."""
+    return DomainEventInterface(**{**_BASE_EVENT_FIELDS, **fields})
+
 
 @pytest.fixture
 def mock_event_repository() -> MagicMock:
     """Create a mock event repository."""
     repo = MagicMock(spec=IEventRepository)
     repo.create = AsyncMock()
+    repo.create_many = AsyncMock(side_effect=lambda entities: entities)
     return repo
 
 
@@ -53,12 +67,10 @@ class TestEventService:
         metadata = {"user_id": "123", "correlation_id": "abc"}
 
         # Mock repository response
-        created_event = DomainEventInterface(
-            event_id=uuid4(),
+        created_event = _event(
             event_type="OrderCreated",
             aggregate_id=order_id,
             aggregate_type="Order",
-            occurred_at=datetime.now(UTC),
             payload=order_data,
             metadata=metadata,
         )
@@ -85,14 +97,11 @@ class TestEventService:
         order_id = uuid4()
         order_data = {"symbol": "ETH/USDT", "side": "sell", "amount": 1.0}
 
-        created_event = DomainEventInterface(
-            event_id=uuid4(),
+        created_event = _event(
             event_type="OrderCreated",
             aggregate_id=order_id,
             aggregate_type="Order",
-            occurred_at=datetime.now(UTC),
             payload=order_data,
-            metadata={},
         )
         mock_event_repository.create.return_value = created_event
 
@@ -112,12 +121,10 @@ class TestEventService:
         reason = "User requested cancellation"
         metadata = {"user_id": "123"}
 
-        created_event = DomainEventInterface(
-            event_id=uuid4(),
+        created_event = _event(
             event_type="OrderCancelled",
             aggregate_id=order_id,
             aggregate_type="Order",
-            occurred_at=datetime.now(UTC),
             payload={"reason": reason},
             metadata=metadata,
         )
@@ -145,12 +152,10 @@ class TestEventService:
         }
         metadata = {"trade_id": "trade_123"}
 
-        created_event = DomainEventInterface(
-            event_id=uuid4(),
+        created_event = _event(
             event_type="OrderFilled",
             aggregate_id=order_id,
             aggregate_type="Order",
-            occurred_at=datetime.now(UTC),
             payload=fill_data,
             metadata=metadata,
         )
@@ -177,14 +182,11 @@ class TestEventService:
             "quantity": 0.1,
         }
 
-        created_event = DomainEventInterface(
-            event_id=uuid4(),
+        created_event = _event(
             event_type="PositionOpened",
             aggregate_id=position_id,
             aggregate_type="Position",
-            occurred_at=datetime.now(UTC),
             payload=position_data,
-            metadata={},
         )
         mock_event_repository.create.return_value = created_event
 
@@ -209,14 +211,11 @@ class TestEventService:
             "exit_order_id": str(uuid4()),
         }
 
-        created_event = DomainEventInterface(
-            event_id=uuid4(),
+        created_event = _event(
             event_type="PositionClosed",
             aggregate_id=position_id,
             aggregate_type="Position",
-            occurred_at=datetime.now(UTC),
             payload=close_data,
-            metadata={},
         )
         mock_event_repository.create.return_value = created_event
 
@@ -236,14 +235,11 @@ class TestEventService:
         order_id = uuid4()
         update_data = {"status": "partially_filled", "filled": 0.05, "remaining": 0.05}
 
-        created_event = DomainEventInterface(
-            event_id=uuid4(),
+        created_event = _event(
             event_type="OrderUpdated",
             aggregate_id=order_id,
             aggregate_type="Order",
-            occurred_at=datetime.now(UTC),
             payload=update_data,
-            metadata={},
         )
         mock_event_repository.create.return_value = created_event
 
@@ -268,14 +264,11 @@ class TestEventService:
             "exchange": "binance",
         }
 
-        created_event = DomainEventInterface(
-            event_id=uuid4(),
+        created_event = _event(
             event_type="TradeExecuted",
             aggregate_id=trade_id,
             aggregate_type="Trade",
-            occurred_at=datetime.now(UTC),
             payload=trade_data,
-            metadata={},
         )
         mock_event_repository.create.return_value = created_event
 
@@ -295,14 +288,11 @@ class TestEventService:
         position_id = uuid4()
         update_data = {"stop_loss": 48000.0, "take_profit": 52000.0}
 
-        created_event = DomainEventInterface(
-            event_id=uuid4(),
+        created_event = _event(
             event_type="PositionUpdated",
             aggregate_id=position_id,
             aggregate_type="Position",
-            occurred_at=datetime.now(UTC),
             payload=update_data,
-            metadata={},
         )
         mock_event_repository.create.return_value = created_event
 
@@ -321,14 +311,11 @@ class TestEventService:
         aggregate_id = uuid4()
         payload = {"message": "Custom event data", "value": 123}
 
-        created_event = DomainEventInterface(
-            event_id=uuid4(),
+        created_event = _event(
             event_type="CustomEvent",
             aggregate_id=aggregate_id,
             aggregate_type="CustomAggregate",
-            occurred_at=datetime.now(UTC),
             payload=payload,
-            metadata={},
         )
         mock_event_repository.create.return_value = created_event
 
@@ -344,6 +331,28 @@ class TestEventService:
         assert result.payload == payload
         mock_event_repository.create.assert_called_once()
 
+    async def test_emit_many_success(
+        self, event_service: EventService, mock_event_repository: MagicMock
+    ) -> None:
+        """Test emitting a batch of events in one repository call."""
+        order_id = uuid4()
+        specs = [
+            EventSpec("OrderCreated", order_id, "Order", {"side": "buy"}),
+            EventSpec("OrderFilled", order_id, "Order", {"filled": 0.1}, {"a": 1}),
+        ]
+
+        result = await event_service.emit_many(specs)
+
+        assert [event.event_type for event in result] == [
+            "OrderCreated",
+            "OrderFilled",
+        ]
+        assert result[0].metadata == {}
+        assert result[1].metadata == {"a": 1}
+        assert result[0].occurred_at < result[1].occurred_at
+        mock_event_repository.create_many.assert_called_once()
+        mock_event_repository.create.assert_not_called()
+
     async def test_get_aggregate_events_success(
         self, event_service: EventService, mock_event_repository: MagicMock
     ) -> None:
@@ -352,23 +361,17 @@ class TestEventService:
         aggregate_type = "Order"
 
         mock_events = [
-            DomainEventInterface(
-                event_id=uuid4(),
+            _event(
                 event_type="OrderCreated",
                 aggregate_id=aggregate_id,
                 aggregate_type=aggregate_type,
-                occurred_at=datetime.now(UTC),
                 payload={"symbol": "BTC/USDT"},
-                metadata={},
             ),
-            DomainEventInterface(
-                event_id=uuid4(),
+            _event(
                 event_type="OrderFilled",
                 aggregate_id=aggregate_id,
                 aggregate_type=aggregate_type,
-                occurred_at=datetime.now(UTC),
                 payload={"filled": 0.1},
-                metadata={},
             ),
         ]
         mock_event_repository.get_by_aggregate.return_value = mock_events
@@ -392,32 +395,23 @@ class TestEventService:
         aggregate_type = "Order"
 
         mock_events = [
-            DomainEventInterface(
-                event_id=uuid4(),
+            _event(
                 event_type="OrderCreated",
                 aggregate_id=aggregate_id,
                 aggregate_type=aggregate_type,
-                occurred_at=datetime.now(UTC),
                 payload={"symbol": "BTC/USDT", "side": "buy", "amount": 0.1},
-                metadata={},
             ),
-            DomainEventInterface(
-                event_id=uuid4(),
+            _event(
                 event_type="OrderUpdated",
                 aggregate_id=aggregate_id,
                 aggregate_type=aggregate_type,
-                occurred_at=datetime.now(UTC),
                 payload={"status": "partially_filled"},
-                metadata={},
             ),
-            DomainEventInterface(
-                event_id=uuid4(),
+            _event(
                 event_type="OrderFilled",
                 aggregate_id=aggregate_id,
                 aggregate_type=aggregate_type,
-                occurred_at=datetime.now(UTC),
                 payload={"filled_amount": 0.1},
-                metadata={},
             ),
         ]
         mock_event_repository.get_by_aggregate.return_value = mock_events
@@ -20,7 +20,7 @@ from crypto_bot.infrastructure.database.repositories.exchange_repository import
 
 
 @pytest_asyncio.fixture(scope="function")
-async def setup_database():
+async def setup_database(worker_database):
     """Set up test database tables."""
     from crypto_bot.infrastructure.database.base import Base
 
@@ -28,7 +28,7 @@ from crypto_bot.infrastructure.database.repositories.trading_pair_repository imp
 
 
 @pytest_asyncio.fixture(scope="function")
-async def setup_database():
+async def setup_database(worker_database):
     """Set up test database tables."""
     from crypto_bot.infrastructure.database.base import Base
 